@@ -38,6 +38,9 @@ def ingest_csv(file_path: Union[str, Path], schema_name: str, **read_csv_kwargs)
     
     Returns:
         Validated DataFrame
+    
+    Raises:
+        pandera.errors.SchemaErrors: If validation fails, listing every failed check
     """
     logger = get_run_logger()
     file_path = Path(file_path)
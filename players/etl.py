@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.schemas import validate_dataframe
 from transformers.shot_distance import calculate_shot_distances
 from transformers.court_time import track_lineup_states
-from transformers.possessions import analyze_possessions
+from transformers.possessions import analyze_possessions, sort_pbp_chronologically
 from transformers.rim_defense import track_rim_defense
 from transformers.impact import calculate_impact
 
@@ -37,6 +37,9 @@ def ingest_csv(file_path: Union[str, Path], schema_name: str, **read_csv_kwargs)
     
     Returns:
         Validated DataFrame
+    
+    Raises:
+        pandera.errors.SchemaErrors: If validation fails, listing every failed check
     """
     logger = get_run_logger()
     file_path = Path(file_path)
@@ -187,6 +190,9 @@ def process_player_impact(file_paths: Dict[str, str],
     box_score_df = ingest_csv(file_paths["box_score"], "box_score")
     pbp_df = ingest_csv(file_paths["pbp"], "pbp")
     
+    # Sort PBP once; possession analysis sees the sorted flag and skips its own sort
+    pbp_df = sort_pbp_chronologically(pbp_df)
+    
     # Step 2: Calculate shot distances and identify rim shots
     logger.info("Step 2: Calculating shot distances...")
     enhanced_pbp_df = calculate_shot_distances_task(pbp_df)
@@ -6,9 +6,13 @@ import numpy as np
 
 from ..transformers.court_time import (
     track_lineup_states, 
+    track_lineup_states_batch,
+    build_onfloor_index,
     _get_starting_lineups, 
     _get_substitution_events,
-    _get_player_activities
+    _get_player_activities,
+    _infer_reentries_from_activity,
+    _build_intervals_from_status_changes
 )
 
 
@@ -73,6 +77,103 @@ class TestTrackLineupStates:
             # Start time should be <= end time
             assert all(result['wallClock_start'] <= result['wallClock_end'])
             assert all(result['period_start'] <= result['period_end'])
+    
+    def test_starter_subbed_out_at_game_start(self):
+        """Test that a starter subbed out at the opening timestamp gets a zero-length interval."""
+        box_score = pd.DataFrame({
+            'nbaId': [101, 102, 106],
+            'nbaTeamId': [1610612745] * 3,
+            'name': ['Player1', 'Player2', 'Player6'],
+            'gs': [1, 1, 0],
+            'min': [0.0, 16.7, 16.7]
+        })
+        pbp = pd.DataFrame({
+            'gameId': ['0022400001'] * 3,
+            'period': [1, 1, 1],
+            'wallClockInt': [1000, 1500, 2000],
+            'msgType': [8, 1, 12],  # Sub at game start, made shot, period end
+            'playerId1': [101, 102, np.nan],
+            'playerId2': [106, np.nan, np.nan],
+            'playerId3': [np.nan, np.nan, np.nan],
+            'description': ['Substitution', 'Made shot', 'End period']
+        })
+        
+        result = track_lineup_states(box_score, pbp)
+        
+        # START sorts before OUT at the same timestamp, so the exit closes the starter's interval
+        intervals = result.sort_values('playerId')[['playerId', 'wallClock_start', 'wallClock_end']]
+        assert intervals.values.tolist() == [[101, 1000, 1000], [102, 1000, 2000], [106, 1000, 2000]]
+
+
+class TestTrackLineupStatesBatch:
+    """Test track_lineup_states_batch function."""
+    
+    def test_matches_single_game_results(self, valid_box_score, valid_pbp):
+        """Test that each game's result matches the single-game tracker, in order."""
+        short_pbp = valid_pbp.iloc[:4].reset_index(drop=True)
+        games = [(valid_box_score, valid_pbp), (valid_box_score, short_pbp)]
+        
+        results = track_lineup_states_batch(games, max_workers=2)
+        
+        assert len(results) == 2
+        pd.testing.assert_frame_equal(results[0], track_lineup_states(valid_box_score, valid_pbp))
+        pd.testing.assert_frame_equal(results[1], track_lineup_states(valid_box_score, short_pbp))
+    
+    def test_empty_batch(self):
+        """Test that no games yields no results."""
+        assert track_lineup_states_batch([]) == []
+
+
+class TestBuildOnfloorIndex:
+    """Test build_onfloor_index function."""
+    
+    def test_finds_all_containing_intervals(self):
+        """Test that long, short and wrong-period intervals are matched correctly."""
+        lineup_intervals = pd.DataFrame({
+            'playerId': [101, 102, 201],
+            'teamId': [1610612745, 1610612745, 1610612742],
+            'period_start': [1, 1, 2],
+            'period_end': [2, 1, 2],
+            'wallClock_start': [0, 900, 900],
+            'wallClock_end': [5000, 1100, 1100]
+        })
+        
+        lookup = build_onfloor_index(lineup_intervals)
+        event_pos, interval_pos = lookup(np.array([1, 1]), np.array([1000.0, 2000.0]))
+        pairs = sorted(zip(event_pos.tolist(), interval_pos.tolist()))
+        
+        assert pairs == [(0, 0), (0, 1), (1, 0)]
+    
+    def test_reuses_index_for_same_frame(self):
+        """Test that the lookup is built once per intervals frame."""
+        lineup_intervals = pd.DataFrame({
+            'playerId': [101],
+            'teamId': [1610612745],
+            'period_start': [1],
+            'period_end': [1],
+            'wallClock_start': [0],
+            'wallClock_end': [100]
+        })
+        
+        assert build_onfloor_index(lineup_intervals) is build_onfloor_index(lineup_intervals)
+    
+    def test_rebuilds_index_after_in_place_edit(self):
+        """Test that editing interval bounds in place is not served a stale index."""
+        lineup_intervals = pd.DataFrame({
+            'playerId': [101],
+            'teamId': [1610612745],
+            'period_start': [1],
+            'period_end': [1],
+            'wallClock_start': [0],
+            'wallClock_end': [100]
+        })
+        build_onfloor_index(lineup_intervals)
+        
+        lineup_intervals.loc[0, 'wallClock_end'] = 1000
+        event_pos, interval_pos = build_onfloor_index(lineup_intervals)(np.array([1]), np.array([500]))
+        
+        assert event_pos.tolist() == [0]
+        assert interval_pos.tolist() == [0]
 
 
 class TestGetStartingLineups:
@@ -139,6 +240,106 @@ class TestGetPlayerActivities:
             assert all(result['msgType'].isin(activity_types))
 
 
+class TestInferReentriesFromActivity:
+    """Test _infer_reentries_from_activity helper function."""
+    
+    @pytest.fixture
+    def substitutions(self):
+        """101 goes out, comes back in, and goes out again; 106 mirrors them."""
+        return pd.DataFrame({
+            'period': [1, 1, 2],
+            'wallClockInt': [1100, 1500, 1700],
+            'playerId1': [101.0, 106.0, 101.0],  # OUT
+            'playerId2': [106.0, 101.0, 106.0]   # IN
+        })
+    
+    @pytest.fixture
+    def team_mapping(self):
+        """Team lookup for the substituted players."""
+        return pd.Series([1610612745, 1610612745], index=[101, 106])
+    
+    def test_first_activity_after_each_out_counts_once(self, substitutions, team_mapping):
+        """Test that only the first activity of each OUT run is inferred as a re-entry."""
+        activities = pd.DataFrame({
+            'period': [1, 1, 1, 2, 2, 2],
+            'wallClockInt': [1000, 1200, 1300, 1600, 1600, 1800],
+            'playerId': [101, 101, 101, 101, 106, 101]
+        })
+        
+        result = _infer_reentries_from_activity(activities, substitutions, team_mapping)
+        
+        # 1000 precedes any sub, 1300 repeats the 1200 run, and 101 is IN at 1600
+        assert result[['playerId', 'period', 'wallClockInt']].values.tolist() == [
+            [101, 1, 1200], [106, 2, 1600], [101, 2, 1800]
+        ]
+        assert (result['action'] == 'IN').all()
+        assert (result['source'] == 'inferred_from_activity').all()
+    
+    def test_player_missing_from_box_score_is_dropped(self, substitutions):
+        """Test that re-entries for players without a team are not emitted."""
+        activities = pd.DataFrame({
+            'period': [1, 1],
+            'wallClockInt': [1200, 1200],
+            'playerId': [101, 106]
+        })
+        
+        result = _infer_reentries_from_activity(activities, substitutions, pd.Series([1610612745], index=[106]))
+        
+        assert result.empty
+
+
+class TestBuildIntervalsFromStatusChanges:
+    """Test _build_intervals_from_status_changes helper function."""
+    
+    def _status_changes(self, rows):
+        """Chronological status changes from (period, wallClockInt, playerId, action) rows."""
+        status_df = pd.DataFrame(rows, columns=['period', 'wallClockInt', 'playerId', 'action'])
+        return status_df.assign(teamId=1610612745)
+    
+    def _intervals(self, result):
+        """Interval rows as lists, ordered by player then start."""
+        cols = ['playerId', 'period_start', 'wallClock_start', 'period_end', 'wallClock_end']
+        return result.sort_values(['playerId', 'wallClock_start'])[cols].values.tolist()
+    
+    def test_later_entry_replaces_unmatched_entry(self):
+        """Test that a second entry before any exit restarts the interval."""
+        status_df = self._status_changes([
+            (1, 1000, 101, 'IN'),
+            (1, 1200, 101, 'IN'),
+            (2, 1500, 101, 'OUT'),
+        ])
+        
+        result = _build_intervals_from_status_changes(status_df, '0022400001', 2000)
+        
+        assert self._intervals(result) == [[101, 1, 1200, 2, 1500]]
+    
+    def test_exit_without_open_entry_is_ignored(self):
+        """Test that an OUT with no open entry does not create or close an interval."""
+        status_df = self._status_changes([
+            (1, 1100, 102, 'OUT'),
+            (1, 1300, 102, 'IN'),
+            (2, 1400, 102, 'OUT'),
+            (2, 1600, 102, 'OUT'),
+        ])
+        
+        result = _build_intervals_from_status_changes(status_df, '0022400001', 2000)
+        
+        assert self._intervals(result) == [[102, 1, 1300, 2, 1400]]
+    
+    def test_open_entry_runs_to_game_end(self):
+        """Test that a player still on court is closed at the final period and game end."""
+        status_df = self._status_changes([
+            (1, 1000, 103, 'START'),
+            (1, 1100, 101, 'IN'),
+            (2, 1500, 101, 'OUT'),
+        ])
+        
+        result = _build_intervals_from_status_changes(status_df, '0022400001', 2000)
+        
+        assert self._intervals(result) == [[101, 1, 1100, 2, 1500], [103, 1, 1000, 2, 2000]]
+        assert (result['gameId'] == '0022400001').all()
+
+
 class TestBasicFunctionality:
     """Test basic functionality and edge cases."""
     
@@ -8,7 +8,8 @@ from ..transformers.possessions import (
     analyze_possessions,
     _get_team_mapping,
     _identify_possessions,
-    _count_player_possessions
+    _count_player_possessions,
+    sort_pbp_chronologically
 )
 
 
@@ -132,6 +133,39 @@ class TestIdentifyPossessions:
                 assert poss['offensive_team'] != poss['defensive_team']
 
 
+class TestSortPbpChronologically:
+    """Test sort_pbp_chronologically function."""
+    
+    def test_sorts_and_flags_frame(self, valid_pbp):
+        """Test that PBP is sorted by period and wallClock and flagged as sorted."""
+        shuffled = valid_pbp.iloc[::-1]
+        
+        result = sort_pbp_chronologically(shuffled)
+        
+        assert result['wallClockInt'].is_monotonic_increasing
+        assert result.attrs['sorted'] is True
+        assert 'sorted' not in shuffled.attrs
+    
+    def test_presorted_possessions_match(self, valid_pbp):
+        """Test that skipping the sort on sorted input gives the same possessions."""
+        expected = _identify_possessions(valid_pbp)
+        
+        result = _identify_possessions(sort_pbp_chronologically(valid_pbp), assume_sorted=True)
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_reordered_flagged_frame_is_sorted_again(self, valid_pbp):
+        """Test that a reordered copy of a flagged frame does not skip the sort."""
+        expected = _identify_possessions(valid_pbp)
+        reordered = sort_pbp_chronologically(valid_pbp).sort_values('wallClockInt', ascending=False)
+        assert reordered.attrs['sorted'] is True
+        
+        result = _identify_possessions(reordered)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        assert (result['start_wallClock'] <= result['end_wallClock']).all()
+
+
 class TestCountPlayerPossessions:
     """Test _count_player_possessions helper function."""
     
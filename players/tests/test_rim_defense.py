@@ -151,6 +151,70 @@ class TestCalculateRimDefenseStats:
                 # Should have some combination of on/off court attempts
                 total_attempts = p203['rim_fga_on'] + p203['rim_fga_off']
                 assert total_attempts > 0
+    
+    def test_exact_on_off_counts(self):
+        """Test exact counts with overlapping intervals and a shot missing defTeamId."""
+        intervals = pd.DataFrame({
+            'playerId': [201, 201, 202, 101],
+            'teamId': [1610612742, 1610612742, 1610612742, 1610612745],
+            'period_start': [1, 1, 1, 1],
+            'period_end': [1, 1, 1, 1],
+            'wallClock_start': [900, 1100, 900, 900],  # 201's intervals overlap at 1150
+            'wallClock_end': [1200, 1600, 1050, 1600]
+        })
+        test_pbp = pd.DataFrame({
+            'period': [1, 1, 1, 1],
+            'wallClockInt': [1000, 1150, 1500, 1550],
+            'msgType': [1, 2, 1, 1],  # Make, miss, make (no defense team), make
+            'offTeamId': [1610612745, 1610612745, 1610612745, 1610612745],
+            'defTeamId': [1610612742, 1610612742, np.nan, 1610612742],
+            'shot_distance': [2.0, 3.0, 1.0, 2.0],
+            'is_rim_shot': [True, True, True, True],
+            'playerId1': [101, 101, 101, 101]
+        })
+        
+        player_teams = _get_player_team_mapping(intervals)
+        result = _calculate_rim_defense_stats(test_pbp, intervals, player_teams).set_index('playerId')
+        
+        # 201 is counted once at 1150 despite two intervals; the 1500 shot is skipped;
+        # 101's team never defended, so 101 has no row
+        counts = result[['rim_fgm_on', 'rim_fga_on', 'rim_fgm_off', 'rim_fga_off']]
+        assert counts.loc[201].tolist() == [2, 3, 0, 0]
+        assert counts.loc[202].tolist() == [1, 1, 1, 2]
+        assert 101 not in result.index
+        
+        assert result.loc[201, 'rim_fg_pct_on'] == pytest.approx(2 / 3)
+        assert np.isnan(result.loc[201, 'rim_fg_pct_off'])
+        assert result.loc[202, 'rim_fg_pct_diff'] == pytest.approx(0.5)
+    
+    def test_interval_player_missing_from_team_mapping(self):
+        """Test that interval players without a team mapping are ignored, not misattributed."""
+        intervals = pd.DataFrame({
+            'playerId': [201, 202, 203],
+            'teamId': [1610612742, 1610612742, 1610612742],
+            'period_start': [1, 1, 1],
+            'period_end': [1, 1, 1],
+            'wallClock_start': [900, 900, 900],
+            'wallClock_end': [1100, 950, 1100]  # 202 is off court at the shot
+        })
+        test_pbp = pd.DataFrame({
+            'period': [1],
+            'wallClockInt': [1000],
+            'msgType': [1],
+            'offTeamId': [1610612745],
+            'defTeamId': [1610612742],
+            'shot_distance': [2.0],
+            'is_rim_shot': [True],
+            'playerId1': [101]
+        })
+        player_teams = {201: 1610612742, 202: 1610612742}  # 203 is unmapped
+        
+        result = _calculate_rim_defense_stats(test_pbp, intervals, player_teams).set_index('playerId')
+        
+        counts = result[['rim_fgm_on', 'rim_fga_on', 'rim_fgm_off', 'rim_fga_off']]
+        assert counts.loc[201].tolist() == [1, 1, 0, 0]
+        assert counts.loc[202].tolist() == [0, 0, 1, 1]
+        assert 203 not in result.index
 
 
 class TestBasicFunctionality:
@@ -216,4 +280,17 @@ class TestBasicFunctionality:
         assert isinstance(result, pd.DataFrame)
         if len(result) > 0:
             # Should handle multiple periods correctly
-            assert len(result) > 0
\ No newline at end of file
+            assert len(result) > 0
+    
+    def test_no_rim_shots(self, enhanced_pbp, lineup_intervals):
+        """Test that no rim shots returns an empty table with the full schema."""
+        no_rim_pbp = enhanced_pbp.assign(is_rim_shot=False)
+        
+        result = track_rim_defense(no_rim_pbp, lineup_intervals)
+        
+        assert len(result) == 0
+        assert list(result.columns) == [
+            'playerId', 'teamId', 'rim_fgm_on', 'rim_fga_on', 'rim_fgm_off', 'rim_fga_off',
+            'rim_fg_pct_on', 'rim_fg_pct_off', 'rim_fg_pct_diff'
+        ]
+        assert result['rim_fga_on'].dtype == np.int64
@@ -4,8 +4,92 @@
 Hybrid lineup tracker that combines explicit substitutions with activity inference.
 """
 
+import functools
+import logging
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
-from typing import Dict, List, Set, Tuple
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tie-break order for status changes that share a timestamp
+_ACTION_RANK = {'START': 0, 'IN': 1, 'OUT': 2}
+
+# Results of frame-keyed helpers, keyed by (helper name, id(frame))
+_cache: Dict[Tuple[str, int], Tuple[weakref.ref, np.ndarray, object]] = {}
+
+
+def _cached_by_frame(*columns: str) -> Callable:
+    """
+    Memoize a helper whose only argument is a DataFrame, keyed by the frame's identity.
+    
+    Entries hold a weak reference and a content hash of ``columns``, so a
+    recycled id or a frame edited in place is recomputed rather than served stale.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(df: pd.DataFrame):
+            key = (func.__name__, id(df))
+            fingerprint = pd.util.hash_pandas_object(df[list(columns)], index=False).to_numpy()
+            entry = _cache.get(key)
+            if entry is not None and entry[0]() is df and np.array_equal(entry[1], fingerprint):
+                return entry[2]
+            
+            result = func(df)
+            _cache[key] = (weakref.ref(df, lambda _: _cache.pop(key, None)), fingerprint, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink ID, period and event columns to compact dtypes for faster merges and groupbys."""
+    compact = {}
+    
+    # Small-range integer columns (float columns with missing IDs are left as is)
+    for col in ['period', 'msgType', 'playerId1', 'playerId2', 'playerId3', 'nbaTeamId']:
+        if col in df.columns:
+            compact[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    # wallClockInt has a large range, so only normalize it to int64
+    if 'wallClockInt' in df.columns:
+        compact['wallClockInt'] = df['wallClockInt'].astype('int64')
+    
+    # Mostly unique free text goes into a contiguous Arrow string buffer
+    if 'description' in df.columns:
+        compact['description'] = df['description'].astype('string[pyarrow]')
+    
+    # Repeated team codes are stored once as categories
+    if 'team' in df.columns:
+        compact['team'] = df['team'].astype('category')
+    
+    return df.assign(**compact)
+
+
+def _chronological_order(period: pd.Series, wall_clock: pd.Series,
+                         tiebreak: np.ndarray = None) -> np.ndarray:
+    """
+    Stable positional order by (period, wallClockInt[, tiebreak]) from one int64 sort key.
+    
+    wallClockInt is an epoch timestamp, so it is offset to the game's first
+    event before packing; the remaining range per game is small enough that
+    period * span + offset cannot overflow.
+    """
+    wall_clock = wall_clock.to_numpy(dtype=np.int64)
+    if len(wall_clock) == 0:
+        return np.arange(0)
+    
+    offset = wall_clock - wall_clock.min()
+    key = period.to_numpy(dtype=np.int64) * (offset.max() + 1) + offset
+    if tiebreak is not None:
+        key = key * (tiebreak.max() + 1) + tiebreak
+    
+    return np.argsort(key, kind='stable')
 
 
 def track_lineup_states(box_score_df: pd.DataFrame, pbp_df: pd.DataFrame) -> pd.DataFrame:
@@ -26,6 +110,9 @@ def track_lineup_states(box_score_df: pd.DataFrame, pbp_df: pd.DataFrame) -> pd.
     starters = _get_starting_lineups(box_score_df)
     team_mapping = _get_team_mapping(box_score_df)
     
+    # Use compact dtypes for all downstream processing
+    pbp_df = _downcast(pbp_df)
+    
     # Get all player activities to detect re-entries
     activities = _get_player_activities(pbp_df)
     
@@ -38,6 +125,74 @@ def track_lineup_states(box_score_df: pd.DataFrame, pbp_df: pd.DataFrame) -> pd.
     return intervals
 
 
+def track_lineup_states_batch(games: Iterable[Tuple[pd.DataFrame, pd.DataFrame]],
+                              max_workers: Optional[int] = None) -> List[pd.DataFrame]:
+    """
+    Run track_lineup_states over many games in parallel worker processes.
+    
+    Args:
+        games: (box_score_df, pbp_df) pairs, one per game
+        max_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        Lineup interval DataFrames in the same order as ``games``
+    """
+    games = list(games)
+    if not games:
+        return []
+    box_scores, pbps = zip(*games)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(track_lineup_states, box_scores, pbps))
+
+
+@_cached_by_frame('period_start', 'period_end', 'wallClock_start', 'wallClock_end')
+def build_onfloor_index(lineup_intervals: pd.DataFrame) -> Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Build a point-in-interval lookup over lineup intervals, cached per intervals frame.
+    
+    Intervals are sorted by start once; each query point then only checks the
+    window of intervals that started within the longest interval length
+    before it, located with np.searchsorted.
+    
+    Args:
+        lineup_intervals: Player court time intervals from track_lineup_states
+        
+    Returns:
+        Function mapping (periods, wallClocks) arrays to (event positions,
+        interval positions) for every interval that contains each point
+    """
+    order = np.argsort(lineup_intervals['wallClock_start'].to_numpy(), kind='stable')
+    starts = lineup_intervals['wallClock_start'].to_numpy()[order]
+    ends = lineup_intervals['wallClock_end'].to_numpy()[order]
+    period_start = lineup_intervals['period_start'].to_numpy()[order]
+    period_end = lineup_intervals['period_end'].to_numpy()[order]
+    max_length = (ends - starts).max() if len(starts) > 0 else 0
+    
+    def lookup(periods: np.ndarray, wall_clocks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(starts) == 0 or len(wall_clocks) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        
+        lo = np.searchsorted(starts, wall_clocks - max_length, side='left')
+        hi = np.searchsorted(starts, wall_clocks, side='right')
+        
+        # Expand each point's candidate window into (event, sorted interval) pairs
+        window = np.maximum(hi - lo, 0)
+        event_pos = np.repeat(np.arange(len(wall_clocks)), window)
+        offsets = np.arange(window.sum()) - np.repeat(np.cumsum(window) - window, window)
+        sorted_pos = np.repeat(lo, window) + offsets
+        
+        contains = (
+            (ends[sorted_pos] >= wall_clocks[event_pos]) &
+            (period_start[sorted_pos] <= periods[event_pos]) &
+            (period_end[sorted_pos] >= periods[event_pos])
+        )
+        
+        return event_pos[contains], order[sorted_pos[contains]]
+    
+    return lookup
+
+
 def _get_starting_lineups(box_score_df: pd.DataFrame) -> Dict[int, Set[int]]:
     """Extract starting lineups by team from box score."""
     starters_df = box_score_df[box_score_df['gs'] == 1]
@@ -50,17 +205,32 @@ def _get_starting_lineups(box_score_df: pd.DataFrame) -> Dict[int, Set[int]]:
     return starters
 
 
-def _get_team_mapping(box_score_df: pd.DataFrame) -> Dict[int, int]:
-    """Map player ID to team ID."""
-    return dict(zip(box_score_df['nbaId'], box_score_df['nbaTeamId']))
+def _get_team_mapping(box_score_df: pd.DataFrame) -> pd.Series:
+    """Map player ID to team ID, as a Series indexed by player ID for fast ``.map``."""
+    players = box_score_df.drop_duplicates('nbaId', keep='last')
+    return pd.Series(players['nbaTeamId'].to_numpy(), index=players['nbaId'].to_numpy())
 
 
 def _get_substitution_events(pbp_df: pd.DataFrame) -> pd.DataFrame:
     """Extract and sort substitution events."""
-    subs = pbp_df[pbp_df['msgType'] == 8].copy()
-    subs = subs.sort_values(['period', 'wallClockInt'], ascending=[True, True])
+    subs = pbp_df.loc[pbp_df['msgType'].to_numpy() == 8, ['period', 'wallClockInt', 'playerId1', 'playerId2', 'description']]
+    subs = subs.iloc[_chronological_order(subs['period'], subs['wallClockInt'])]
     
-    return subs[['period', 'wallClockInt', 'playerId1', 'playerId2', 'description']].reset_index(drop=True)
+    return subs.reset_index(drop=True)
+
+
+def _msg_type_mask(msg_type: pd.Series, msg_types: List[int]) -> np.ndarray:
+    """Boolean mask of rows whose msgType is in msg_types, via a lookup table gather."""
+    lookup = np.zeros(max(msg_types) + 1, dtype=bool)
+    lookup[msg_types] = True
+    
+    # Values outside the table (including missing) are never a match
+    msg = msg_type.to_numpy(dtype=np.float64, na_value=-1)
+    in_table = (msg >= 0) & (msg < len(lookup))
+    mask = np.zeros(len(msg), dtype=bool)
+    mask[in_table] = lookup[msg[in_table].astype(np.intp)]
+    
+    return mask
 
 
 def _get_player_activities(pbp_df: pd.DataFrame) -> pd.DataFrame:
@@ -68,27 +238,41 @@ def _get_player_activities(pbp_df: pd.DataFrame) -> pd.DataFrame:
     # Activity types that indicate player is on court
     activity_msg_types = [1, 2, 3, 4, 5, 6, 7]  # Made shot, missed shot, free throw, rebound, turnover, foul, violation
     
-    activities = pbp_df[pbp_df['msgType'].isin(activity_msg_types)].copy()
-    
-    # Expand to track all players involved in each activity
-    activity_list = []
-    
-    for _, row in activities.iterrows():
-        for player_col in ['playerId1', 'playerId2', 'playerId3']:
-            if pd.notna(row[player_col]):
-                activity_list.append({
-                    'period': row['period'],
-                    'wallClockInt': row['wallClockInt'],
-                    'playerId': int(row[player_col]),
-                    'msgType': row['msgType'],
-                    'description': row['description']
-                })
-    
-    return pd.DataFrame(activity_list).sort_values(['period', 'wallClockInt'])
+    activities = pbp_df.loc[
+        _msg_type_mask(pbp_df['msgType'], activity_msg_types),
+        ['period', 'wallClockInt', 'msgType', 'description', 'playerId1', 'playerId2', 'playerId3']
+    ]
+    
+    # Expand to track all players involved in each activity: one block of
+    # rows per playerId column, filled by slice into preallocated arrays
+    n_events = len(activities)
+    n = n_events * 3
+    period = np.empty(n, dtype=np.int16)
+    wall_clock = np.empty(n, dtype=np.int64)
+    player_id = np.empty(n, dtype=np.float64)
+    msg_type = np.empty(n, dtype=np.int8)
+    for i, col in enumerate(['playerId1', 'playerId2', 'playerId3']):
+        block = slice(i * n_events, (i + 1) * n_events)
+        period[block] = activities['period'].to_numpy()
+        wall_clock[block] = activities['wallClockInt'].to_numpy()
+        player_id[block] = activities[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        msg_type[block] = activities['msgType'].to_numpy()
+    
+    has_player = ~np.isnan(player_id)
+    source_rows = np.tile(np.arange(n_events), 3)[has_player]
+    activity_long = pd.DataFrame({
+        'period': period[has_player],
+        'wallClockInt': wall_clock[has_player],
+        'playerId': player_id[has_player].astype(np.int64),
+        'msgType': msg_type[has_player],
+        'description': activities['description'].iloc[source_rows].array,
+    })
+    
+    return activity_long.iloc[_chronological_order(activity_long['period'], activity_long['wallClockInt'])]
 
 
 def _build_hybrid_intervals(starters: Dict[int, Set[int]], 
-                           team_mapping: Dict[int, int],
+                           team_mapping: pd.Series,
                            substitutions: pd.DataFrame,
                            activities: pd.DataFrame,
                            pbp_df: pd.DataFrame) -> pd.DataFrame:
@@ -99,60 +283,57 @@ def _build_hybrid_intervals(starters: Dict[int, Set[int]],
     game_start_wallClock = pbp_df[pbp_df['period'] == 1]['wallClockInt'].min()
     game_end_wallClock = pbp_df[pbp_df['period'] == max_period]['wallClockInt'].max()
     
-    print(f"HYBRID DEBUG: Processing {len(substitutions)} substitutions and {len(activities)} activities")
-    
-    # Create timeline of all player status changes
-    status_changes = []
+    logger.debug("HYBRID DEBUG: Processing %d substitutions and %d activities", len(substitutions), len(activities))
     
     # Add game start for starters
-    for team_id, players in starters.items():
-        for player_id in players:
-            status_changes.append({
-                'period': 1,
-                'wallClockInt': game_start_wallClock,
-                'playerId': player_id,
-                'teamId': team_id,
-                'action': 'START',
-                'source': 'starter'
-            })
-    
-    # Add explicit substitutions
-    for _, sub in substitutions.iterrows():
-        player_out = int(sub['playerId1'])
-        player_in = int(sub['playerId2'])
-        
-        # Player going out
-        team_id = team_mapping.get(player_out)
-        if team_id:
-            status_changes.append({
-                'period': sub['period'],
-                'wallClockInt': sub['wallClockInt'],
-                'playerId': player_out,
-                'teamId': team_id,
-                'action': 'OUT',
-                'source': 'substitution'
-            })
-        
-        # Player coming in
-        team_id = team_mapping.get(player_in)
-        if team_id:
-            status_changes.append({
-                'period': sub['period'],
-                'wallClockInt': sub['wallClockInt'],
-                'playerId': player_in,
-                'teamId': team_id,
-                'action': 'IN',
-                'source': 'substitution'
-            })
+    team_sizes = [len(players) for players in starters.values()]
+    starter_changes = pd.DataFrame({
+        'period': 1,
+        'wallClockInt': game_start_wallClock,
+        'playerId': np.fromiter(
+            (player_id for players in starters.values() for player_id in players),
+            dtype=np.int64, count=sum(team_sizes)
+        ),
+        'teamId': np.repeat(np.fromiter(starters.keys(), dtype=np.int64, count=len(starters)), team_sizes),
+        'action': 'START',
+        'source': 'starter'
+    })
+    
+    # Add explicit substitutions (playerId1 goes out, playerId2 comes in)
+    subs_out = pd.DataFrame({
+        'period': substitutions['period'].values,
+        'wallClockInt': substitutions['wallClockInt'].values,
+        'playerId': substitutions['playerId1'].astype('int64').values,
+        'action': 'OUT',
+        'source': 'substitution'
+    })
+    subs_in = pd.DataFrame({
+        'period': substitutions['period'].values,
+        'wallClockInt': substitutions['wallClockInt'].values,
+        'playerId': substitutions['playerId2'].astype('int64').values,
+        'action': 'IN',
+        'source': 'substitution'
+    })
+    
+    # Look up teams in one pass and drop players missing from the box score
+    subs_out['teamId'] = subs_out['playerId'].map(team_mapping)
+    subs_in['teamId'] = subs_in['playerId'].map(team_mapping)
+    sub_changes = pd.concat([subs_out, subs_in], ignore_index=True).dropna(subset=['teamId'])
+    sub_changes['teamId'] = sub_changes['teamId'].astype('int64')
     
     # Add inferred re-entries from activity
     inferred_entries = _infer_reentries_from_activity(activities, substitutions, team_mapping)
-    status_changes.extend(inferred_entries)
     
-    # Sort all status changes chronologically
-    status_df = pd.DataFrame(status_changes).sort_values(['period', 'wallClockInt', 'action'])
+    # Sort all status changes chronologically; at equal timestamps starts come
+    # before entries, and entries before exits
+    status_df = pd.concat(
+        [starter_changes, sub_changes, inferred_entries],
+        ignore_index=True
+    )
+    action_rank = status_df['action'].map(_ACTION_RANK).to_numpy(dtype=np.int64)
+    status_df = status_df.iloc[_chronological_order(status_df['period'], status_df['wallClockInt'], action_rank)]
     
-    print(f"HYBRID DEBUG: Total status changes: {len(status_df)}")
+    logger.debug("HYBRID DEBUG: Total status changes: %d", len(status_df))
     
     # Build intervals from status changes
     intervals = _build_intervals_from_status_changes(status_df, game_id, game_end_wallClock)
@@ -162,80 +343,64 @@ def _build_hybrid_intervals(starters: Dict[int, Set[int]],
 
 def _infer_reentries_from_activity(activities: pd.DataFrame, 
                                  substitutions: pd.DataFrame,
-                                 team_mapping: Dict[int, int]) -> List[Dict]:
+                                 team_mapping: pd.Series) -> pd.DataFrame:
     """Infer when players re-enter the game based on their activity."""
     
-    inferred_entries = []
-    
-    # Combine all events (substitutions + activities) and sort chronologically
-    all_events = []
-    
-    # Add substitution events
-    for _, sub in substitutions.iterrows():
-        all_events.append({
-            'period': sub['period'],
-            'wallClockInt': sub['wallClockInt'],
-            'event_type': 'substitution',
-            'player_out': int(sub['playerId1']),
-            'player_in': int(sub['playerId2'])
-        })
-    
-    # Add activity events
-    for _, activity in activities.iterrows():
-        all_events.append({
-            'period': activity['period'],
-            'wallClockInt': activity['wallClockInt'],
-            'event_type': 'activity',
-            'player_id': activity['playerId'],
-            'msgType': activity['msgType']
-        })
-    
-    # Sort all events chronologically
-    all_events_df = pd.DataFrame(all_events).sort_values(['period', 'wallClockInt'])
-    
-    # Track current status for each player
-    player_status = {}  # player_id -> 'IN'/'OUT'
-    
-    print(f"FIXED INFERENCE DEBUG: Processing {len(all_events_df)} chronological events")
-    
-    # Process events chronologically
-    for i, (_, event) in enumerate(all_events_df.iterrows()):
-        
-        if event['event_type'] == 'substitution':
-            # Update player statuses
-            player_out = event['player_out']
-            player_in = event['player_in']
-            
-            player_status[player_out] = 'OUT'
-            player_status[player_in] = 'IN'
-            
-            if i < 10:  # Debug first few
-                print(f"  Sub: Player {player_out} OUT, Player {player_in} IN at period {event['period']}")
-        
-        elif event['event_type'] == 'activity':
-            player_id = event['player_id']
-            current_status = player_status.get(player_id, 'UNKNOWN')
-            
-            # If player has activity but status shows OUT, they must have re-entered
-            if current_status == 'OUT':
-                team_id = team_mapping.get(player_id)
-                if team_id:
-                    inferred_entries.append({
-                        'period': event['period'],
-                        'wallClockInt': event['wallClockInt'],
-                        'playerId': player_id,
-                        'teamId': team_id,
-                        'action': 'IN',
-                        'source': 'inferred_from_activity'
-                    })
-                    
-                    # Update status
-                    player_status[player_id] = 'IN'
-                    
-                    if len(inferred_entries) <= 5:  # Debug first few inferences
-                        print(f"  INFERRED: Player {player_id} re-entered at period {event['period']}, wallClock {event['wallClockInt']}")
-    
-    print(f"FIXED INFERENCE DEBUG: Inferred {len(inferred_entries)} re-entries")
+    # Combine substitution and activity events into one long frame, in the
+    # order they should be processed when timestamps tie
+    n_subs = len(substitutions)
+    sub_events = pd.DataFrame({
+        'period': np.repeat(substitutions['period'].values, 2),
+        'wallClockInt': np.repeat(substitutions['wallClockInt'].values, 2),
+        'playerId': np.column_stack([
+            substitutions['playerId1'].astype('int64').values,
+            substitutions['playerId2'].astype('int64').values
+        ]).ravel(),
+        'sub_status': np.tile(['OUT', 'IN'], n_subs)
+    })
+    activity_events = pd.DataFrame({
+        'period': activities['period'].values,
+        'wallClockInt': activities['wallClockInt'].values,
+        'playerId': activities['playerId'].values,
+        'sub_status': None
+    })
+    all_events = pd.concat([sub_events, activity_events], ignore_index=True)
+    all_events['event_order'] = np.arange(len(all_events))
+    
+    logger.debug("FIXED INFERENCE DEBUG: Processing %d chronological events", len(all_events))
+    
+    # Walk each player's events chronologically
+    all_events = all_events.sort_values(['playerId', 'period', 'wallClockInt', 'event_order'])
+    is_sub = all_events['sub_status'].notna()
+    
+    # Status from the player's most recent substitution, and which
+    # substitution run each event falls in
+    last_sub_status = all_events.groupby('playerId', sort=False)['sub_status'].ffill()
+    sub_run = is_sub.astype('int64').groupby(all_events['playerId'], sort=False).cumsum()
+    
+    # If player has activity but status shows OUT, they must have re-entered.
+    # Only the first such activity per run counts; the player is IN afterwards.
+    candidates = all_events[~is_sub & (last_sub_status == 'OUT')]
+    reentries = candidates.groupby([candidates['playerId'], sub_run[candidates.index]], sort=False).head(1)
+    
+    reentries = reentries.assign(teamId=reentries['playerId'].map(team_mapping)).dropna(subset=['teamId'])
+    reentries = reentries.sort_values('event_order')
+    
+    inferred_entries = pd.DataFrame({
+        'period': reentries['period'].values,
+        'wallClockInt': reentries['wallClockInt'].values,
+        'playerId': reentries['playerId'].values,
+        'teamId': reentries['teamId'].astype('int64').values,
+        'action': 'IN',
+        'source': 'inferred_from_activity'
+    })
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        for entry in inferred_entries.head(5).itertuples(index=False):  # Debug first few inferences
+            logger.debug("  INFERRED: Player %s re-entered at period %s, wallClock %s",
+                         entry.playerId, entry.period, entry.wallClockInt)
+    
+    logger.debug("FIXED INFERENCE DEBUG: Inferred %d re-entries", len(inferred_entries))
     
     return inferred_entries
 
@@ -245,61 +410,52 @@ def _build_intervals_from_status_changes(status_df: pd.DataFrame,
                                        game_end_wallClock: int) -> pd.DataFrame:
     """Build final intervals from all status changes."""
     
-    intervals = []
-    player_entry_times = {}  # player_id -> (period, wallClock, team_id)
+    # Group each player's changes together, keeping chronological order within a player
+    status_df = status_df.iloc[np.argsort(status_df['playerId'].to_numpy(), kind='stable')]
+    player_ids = status_df['playerId'].to_numpy()
+    team_ids = status_df['teamId'].to_numpy()
+    periods = status_df['period'].to_numpy()
+    wallClocks = status_df['wallClockInt'].to_numpy()
+    is_entry = status_df['action'].isin(['START', 'IN']).to_numpy()
     
-    for _, change in status_df.iterrows():
-        player_id = change['playerId']
-        
-        if change['action'] in ['START', 'IN']:
-            # Player enters court
-            player_entry_times[player_id] = (
-                change['period'], 
-                change['wallClockInt'], 
-                change['teamId']
-            )
-            
-        elif change['action'] == 'OUT' and player_id in player_entry_times:
-            # Player exits court - create interval
-            entry_period, entry_wallClock, team_id = player_entry_times[player_id]
-            
-            intervals.append({
-                'gameId': game_id,
-                'playerId': player_id,
-                'teamId': team_id,
-                'period_start': entry_period,
-                'wallClock_start': entry_wallClock,
-                'period_end': change['period'],
-                'wallClock_end': change['wallClockInt']
-            })
-            
-            del player_entry_times[player_id]
+    first_of_player = np.ones(len(status_df), dtype=bool)
+    first_of_player[1:] = player_ids[1:] != player_ids[:-1]
+    last_of_player = np.roll(first_of_player, -1)
+    
+    # Player exits court - an OUT closes an interval when the player's previous
+    # change was an entry (a later entry replaces an earlier unmatched one)
+    exit_pos = np.flatnonzero(~is_entry & ~first_of_player & np.roll(is_entry, 1))
     
     # Handle players still on court at game end
+    open_pos = np.flatnonzero(is_entry & last_of_player)
     max_period = status_df['period'].max()
-    for player_id, (entry_period, entry_wallClock, team_id) in player_entry_times.items():
-        intervals.append({
-            'gameId': game_id,
-            'playerId': player_id,
-            'teamId': team_id,
-            'period_start': entry_period,
-            'wallClock_start': entry_wallClock,
-            'period_end': max_period,
-            'wallClock_end': game_end_wallClock
-        })
     
-    return pd.DataFrame(intervals)
+    entry_pos = np.concatenate([exit_pos - 1, open_pos])
+    intervals = pd.DataFrame({
+        'gameId': game_id,
+        'playerId': player_ids[entry_pos],
+        'teamId': team_ids[entry_pos],
+        'period_start': periods[entry_pos],
+        'wallClock_start': wallClocks[entry_pos],
+        'period_end': np.concatenate([periods[exit_pos], np.full(len(open_pos), max_period)]),
+        'wallClock_end': np.concatenate([wallClocks[exit_pos], np.full(len(open_pos), game_end_wallClock)])
+    })
+    
+    return intervals
 
 
 def validate_against_box_score(intervals_df: pd.DataFrame, box_score_df: pd.DataFrame):
     """Validate calculated intervals against box score minutes."""
     
     # Calculate total court time per player
-    player_totals = intervals_df.groupby('playerId').apply(
-        lambda group: (group['wallClock_end'] - group['wallClock_start']).sum(),
-        include_groups=False
-    ).reset_index()
-    player_totals.columns = ['playerId', 'total_wallClock_units']
+    intervals_df = intervals_df.assign(
+        delta=intervals_df['wallClock_end'].values - intervals_df['wallClock_start'].values
+    )
+    player_totals = (
+        intervals_df.groupby('playerId')['delta']
+        .sum()
+        .reset_index(name='total_wallClock_units')
+    )
     
     # Merge with box score
     comparison = player_totals.merge(
@@ -328,12 +484,21 @@ def validate_against_box_score(intervals_df: pd.DataFrame, box_score_df: pd.Data
     print(f"\n=== ALL PLAYERS COMPARISON ===")
     comparison_sorted = comparison.sort_values('minutes_diff', ascending=True)
     
-    print("Player                    Actual  Calculated  Diff   Status")
-    print("-" * 60)
-    for _, row in comparison_sorted.iterrows():
-        status = "STARTER" if row['gs'] == 1 else "BENCH  "
-        diff_indicator = "✅" if row['minutes_diff'] <= 2.0 else "❌"
-        print(f"{row['name']:<20} {row['min']:>6.1f}  {row['calculated_minutes']:>10.1f}  {row['minutes_diff']:>4.1f}  {status}  {diff_indicator}")
+    report = comparison_sorted[['name', 'min', 'calculated_minutes', 'minutes_diff']].assign(
+        status=np.where(comparison_sorted['gs'] == 1, 'STARTER', 'BENCH'),
+        ok=np.where(comparison_sorted['minutes_diff'] <= 2.0, '✅', '❌')
+    )
+    print(report.to_string(
+        index=False,
+        header=['Player', 'Actual', 'Calculated', 'Diff', 'Status', ''],
+        justify='left',
+        formatters={
+            'name': '{:<20}'.format,
+            'min': '{:.1f}'.format,
+            'calculated_minutes': '{:.1f}'.format,
+            'minutes_diff': '{:.1f}'.format,
+        }
+    ))
     
     # Show key players separately for emphasis
     key_players = [202691, 203957]  # Klay, Exum
@@ -369,9 +534,19 @@ def validate_against_box_score(intervals_df: pd.DataFrame, box_score_df: pd.Data
 
 
 if __name__ == "__main__":
-    # Load test data
-    box_score_df = pd.read_csv("../../data/box_HOU-DAL.csv")
-    pbp_df = pd.read_csv("../../data/pbp_HOU-DAL.csv")
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
+    # Load test data (only the columns lineup tracking reads)
+    box_score_df = pd.read_csv(
+        "../../data/box_HOU-DAL.csv",
+        engine='pyarrow',
+        usecols=['nbaId', 'nbaTeamId', 'name', 'team', 'gs', 'min']
+    )
+    pbp_df = pd.read_csv(
+        "../../data/pbp_HOU-DAL.csv",
+        engine='pyarrow',
+        usecols=['gameId', 'period', 'wallClockInt', 'msgType', 'description', 'playerId1', 'playerId2', 'playerId3']
+    )
     
     print("Processing hybrid lineup tracking...")
     lineup_intervals = track_lineup_states(box_score_df, pbp_df)
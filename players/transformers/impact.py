@@ -4,8 +4,12 @@
 Calculate final player impact table combining possession counts and rim defense stats.
 """
 
+import logging
+
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 
 def calculate_impact(rim_defense_df: pd.DataFrame, 
                     possession_counts_df: pd.DataFrame, 
@@ -25,36 +29,28 @@ def calculate_impact(rim_defense_df: pd.DataFrame,
          Opponent rim FG% when off court, Opponent rim FG% on/off difference]
     """
     
-    print(f"IMPACT DEBUG: Combining data for {len(rim_defense_df)} players with rim defense stats")
-    
-    # Start with rim defense stats as base
-    impact_table = rim_defense_df.copy()
-    
-    # Merge with possession counts
-    impact_table = impact_table.merge(
-        possession_counts_df[['playerId', 'offensive_possessions', 'defensive_possessions']], 
-        on='playerId', 
-        how='left'
-    )
-    
-    # Merge with player names and team info from box score
-    impact_table = impact_table.merge(
-        box_score_df[['nbaId', 'name', 'team']], 
-        left_on='playerId', 
-        right_on='nbaId',
-        how='left'
-    )
-    
-    # Create final table with target column structure
-    final_table = pd.DataFrame({
-        'Player ID': impact_table['playerId'],
-        'Player Name': impact_table['name'],
-        'Team': impact_table['team'],
-        'Offensive possessions played': impact_table['offensive_possessions'],
-        'Defensive possessions played': impact_table['defensive_possessions'],
-        'Opponent rim FG% when player ON court': impact_table['rim_fg_pct_on'],
-        'Opponent rim FG% when player OFF court': impact_table['rim_fg_pct_off'], 
-        'Opponent rim FG% on/off difference (on-off)': impact_table['rim_fg_pct_diff']
+    logger.debug("IMPACT DEBUG: Combining data for %d players with rim defense stats", len(rim_defense_df))
+    
+    # Index every input by player ID once and join on the indexes
+    possessions = possession_counts_df.set_index('playerId')[['offensive_possessions', 'defensive_possessions']]
+    players = box_score_df.set_index('nbaId')[['name', 'team']]
+    
+    impact_table = rim_defense_df.set_index('playerId').join(possessions).join(players)
+    
+    # Select and rename into the target column structure
+    final_table = impact_table.reset_index()[[
+        'playerId', 'name', 'team',
+        'offensive_possessions', 'defensive_possessions',
+        'rim_fg_pct_on', 'rim_fg_pct_off', 'rim_fg_pct_diff'
+    ]].rename(columns={
+        'playerId': 'Player ID',
+        'name': 'Player Name',
+        'team': 'Team',
+        'offensive_possessions': 'Offensive possessions played',
+        'defensive_possessions': 'Defensive possessions played',
+        'rim_fg_pct_on': 'Opponent rim FG% when player ON court',
+        'rim_fg_pct_off': 'Opponent rim FG% when player OFF court',
+        'rim_fg_pct_diff': 'Opponent rim FG% on/off difference (on-off)'
     })
     
     # Round percentages for readability
@@ -64,13 +60,12 @@ def calculate_impact(rim_defense_df: pd.DataFrame,
         'Opponent rim FG% on/off difference (on-off)'
     ]
     
-    for col in percentage_cols:
-        final_table[col] = final_table[col].round(3)
+    final_table.loc[:, percentage_cols] = final_table[percentage_cols].round(3)
     
     # Sort by defensive impact (most negative difference = best defenders)
     final_table = final_table.sort_values('Opponent rim FG% on/off difference (on-off)', ascending=True)
     
-    print(f"IMPACT DEBUG: Generated final table with {len(final_table)} players")
+    logger.debug("IMPACT DEBUG: Generated final table with %d players", len(final_table))
     
     return final_table
 
@@ -144,6 +139,8 @@ def export_final_table(final_table: pd.DataFrame, filename: str = "player_rim_de
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     # Load test data
     box_score_df = pd.read_csv("../../data/box_HOU-DAL.csv")
     pbp_df = pd.read_csv("../../data/pbp_HOU-DAL.csv")
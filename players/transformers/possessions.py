@@ -5,13 +5,24 @@ Analyze possessions from play-by-play data and count possessions per player.
 Clean modular design - takes lineup intervals as input parameter.
 """
 
+import logging
+
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Tuple
 
+try:
+    from .court_time import build_onfloor_index
+except ImportError:  # run as a script from this directory
+    from court_time import build_onfloor_index
+
+logger = logging.getLogger(__name__)
+
 
 def analyze_possessions(box_score_df: pd.DataFrame, 
                       pbp_df: pd.DataFrame, 
-                      lineup_intervals: pd.DataFrame) -> pd.DataFrame:
+                      lineup_intervals: pd.DataFrame,
+                      assume_sorted: bool = False) -> pd.DataFrame:
     """
     Analyze possessions and count offensive/defensive possessions per player.
     
@@ -19,6 +30,7 @@ def analyze_possessions(box_score_df: pd.DataFrame,
         box_score_df: Box score data (for team mapping)
         pbp_df: Play-by-play data with possession events
         lineup_intervals: Player court time intervals from lineup tracker
+        assume_sorted: Skip re-sorting pbp_df; it is already in (period, wallClockInt) order
         
     Returns:
         DataFrame with columns: [playerId, offensive_possessions, defensive_possessions]
@@ -27,7 +39,7 @@ def analyze_possessions(box_score_df: pd.DataFrame,
     team_mapping = _get_team_mapping(box_score_df)
     
     # Identify possession boundaries
-    possessions = _identify_possessions(pbp_df)
+    possessions = _identify_possessions(pbp_df, assume_sorted=assume_sorted)
     
     # Count possessions per player using provided lineup intervals
     player_possessions = _count_player_possessions(possessions, lineup_intervals, team_mapping)
@@ -35,12 +47,34 @@ def analyze_possessions(box_score_df: pd.DataFrame,
     return player_possessions
 
 
+def sort_pbp_chronologically(pbp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort PBP by (period, wallClockInt) once, for reuse by every downstream step.
+    
+    The result is flagged with ``attrs['sorted'] = True`` so possession
+    analysis can skip its own sort. pandas carries attrs over to reordered
+    copies, so the flag is only trusted after an O(N) order check.
+    """
+    pbp_sorted = pbp_df.sort_values(['period', 'wallClockInt']).reset_index(drop=True)
+    pbp_sorted.attrs['sorted'] = True
+    
+    return pbp_sorted
+
+
+def _is_chronological(pbp_df: pd.DataFrame) -> bool:
+    """Check in one pass that PBP rows are in (period, wallClockInt) order."""
+    period_step = np.diff(pbp_df['period'].to_numpy(dtype=np.float64))
+    wall_clock_step = np.diff(pbp_df['wallClockInt'].to_numpy(dtype=np.float64))
+    
+    return bool(np.all((period_step > 0) | ((period_step == 0) & (wall_clock_step >= 0))))
+
+
 def _get_team_mapping(box_score_df: pd.DataFrame) -> Dict[int, int]:
     """Map player ID to team ID."""
     return dict(zip(box_score_df['nbaId'], box_score_df['nbaTeamId']))
 
 
-def _identify_possessions(pbp_df: pd.DataFrame) -> pd.DataFrame:
+def _identify_possessions(pbp_df: pd.DataFrame, assume_sorted: bool = False) -> pd.DataFrame:
     """
     Identify possession boundaries from PBP events.
     
@@ -53,106 +87,77 @@ def _identify_possessions(pbp_df: pd.DataFrame) -> pd.DataFrame:
     - End of period
     """
     
-    # Sort PBP chronologically
-    pbp_sorted = pbp_df.sort_values(['period', 'wallClockInt']).reset_index(drop=True)
-    
-    possessions = []
-    current_possession = None
-    
-    print(f"POSSESSION DEBUG: Processing {len(pbp_sorted)} PBP events")
-    
-    for i, (_, event) in enumerate(pbp_sorted.iterrows()):
-        
-        # Start new possession if needed
-        if current_possession is None:
-            current_possession = {
-                'possession_id': len(possessions) + 1,
-                'start_period': event['period'],
-                'start_wallClock': event['wallClockInt'],
-                'offensive_team': event['offTeamId'] if pd.notna(event['offTeamId']) else None,
-                'defensive_team': event['defTeamId'] if pd.notna(event['defTeamId']) else None,
-                'events': []
-            }
-        
-        # Add event to current possession
-        current_possession['events'].append({
-            'period': event['period'],
-            'wallClockInt': event['wallClockInt'],
-            'msgType': event['msgType'],
-            'actionType': event['actionType'],
-            'description': event.get('description', ''),
-            'playerId1': event.get('playerId1'),
-            'playerId2': event.get('playerId2')
-        })
-        
-        # Check if this event ends the possession
-        possession_ended = False
-        end_reason = None
-        
-        # Made shot ends possession (offense scores)
-        if event['msgType'] == 1:  # Made shot
-            # Check if next event is offensive rebound (possession continues)
-            next_is_oreb = False
-            if i + 1 < len(pbp_sorted):
-                next_event = pbp_sorted.iloc[i + 1]
-                if (next_event['msgType'] == 4 and  # Rebound
-                    next_event['actionType'] == 0):  # Need to check if offensive
-                    # This is a simplification - would need more logic to determine offensive vs defensive rebound
-                    pass
-            
-            if not next_is_oreb:
-                possession_ended = True
-                end_reason = "made_shot"
-        
-        # Missed shot - check next event for rebound
-        elif event['msgType'] == 2:  # Missed shot
-            if i + 1 < len(pbp_sorted):
-                next_event = pbp_sorted.iloc[i + 1]
-                if next_event['msgType'] == 4:  # Rebound
-                    # Determine if defensive rebound (possession change)
-                    # This is simplified - in reality need to check team of rebounder
-                    possession_ended = True
-                    end_reason = "defensive_rebound"
-        
-        # Turnover ends possession
-        elif event['msgType'] == 5:  # Turnover
-            possession_ended = True
-            end_reason = "turnover"
-        
-        # End of period ends possession
-        elif event['msgType'] == 13:  # End period
-            possession_ended = True
-            end_reason = "end_period"
-        
-        # Foul can end possession (simplified)
-        elif event['msgType'] == 6:  # Foul
-            # Some fouls end possessions, others don't - simplified logic
-            if 'FLAGRANT' in str(event.get('description', '')).upper():
-                possession_ended = True
-                end_reason = "foul"
-        
-        # End current possession if criteria met
-        if possession_ended:
-            current_possession['end_period'] = event['period']
-            current_possession['end_wallClock'] = event['wallClockInt']
-            current_possession['end_reason'] = end_reason
-            current_possession['event_count'] = len(current_possession['events'])
-            
-            possessions.append(current_possession)
-            current_possession = None
+    # Sort PBP chronologically, unless the caller already did. The attrs flag
+    # survives later reordering (sort_values, iloc, ...), so it is re-checked.
+    if assume_sorted or (pbp_df.attrs.get('sorted', False) and _is_chronological(pbp_df)):
+        pbp_sorted = pbp_df
+    else:
+        pbp_sorted = sort_pbp_chronologically(pbp_df)
+    
+    logger.debug("POSSESSION DEBUG: Processing %d PBP events", len(pbp_sorted))
+    
+    if len(pbp_sorted) == 0:
+        logger.debug("POSSESSION DEBUG: Identified 0 possessions")
+        return pd.DataFrame()
+    
+    msg_type = pbp_sorted['msgType'].to_numpy()
+    
+    # Missed shot followed by a rebound (simplified - in reality need to check team of rebounder)
+    next_msg_type = np.roll(msg_type, -1)
+    next_msg_type[-1] = -1  # the last event has no next event
+    next_is_rebound = next_msg_type == 4
+    
+    # Some fouls end possessions, others don't - simplified logic
+    if 'description' in pbp_sorted.columns:
+        is_flagrant = (
+            pbp_sorted['description'].astype('string')
+            .str.contains('FLAGRANT', case=False, regex=False, na=False)
+            .to_numpy(dtype=bool)
+        )
+    else:
+        is_flagrant = np.zeros(len(pbp_sorted), dtype=bool)
+    
+    # Classify the event that ends each possession
+    end_reason = np.select(
+        [
+            msg_type == 1,                        # Made shot
+            (msg_type == 2) & next_is_rebound,    # Missed shot, then rebound
+            msg_type == 5,                        # Turnover
+            msg_type == 13,                       # End period
+            (msg_type == 6) & is_flagrant,        # Foul
+        ],
+        ['made_shot', 'defensive_rebound', 'turnover', 'end_period', 'foul'],
+        default=''
+    )
+    ended = end_reason != ''
     
     # Handle final possession if game ended without explicit end
-    if current_possession is not None:
-        final_event = pbp_sorted.iloc[-1]
-        current_possession['end_period'] = final_event['period']
-        current_possession['end_wallClock'] = final_event['wallClockInt']
-        current_possession['end_reason'] = "game_end"
-        current_possession['event_count'] = len(current_possession['events'])
-        possessions.append(current_possession)
-    
-    print(f"POSSESSION DEBUG: Identified {len(possessions)} possessions")
-    
-    return pd.DataFrame(possessions)
+    if not ended[-1]:
+        end_reason[-1] = 'game_end'
+        ended[-1] = True
+    
+    # Each possession runs from the event after the previous end through its own end
+    end_idx = np.flatnonzero(ended)
+    start_idx = np.r_[0, end_idx[:-1] + 1]
+    
+    period = pbp_sorted['period'].to_numpy()
+    wall_clock = pbp_sorted['wallClockInt'].to_numpy()
+    
+    possessions = pd.DataFrame({
+        'possession_id': np.arange(1, len(end_idx) + 1),
+        'start_period': period[start_idx],
+        'start_wallClock': wall_clock[start_idx],
+        'offensive_team': pbp_sorted['offTeamId'].to_numpy()[start_idx],
+        'defensive_team': pbp_sorted['defTeamId'].to_numpy()[start_idx],
+        'end_period': period[end_idx],
+        'end_wallClock': wall_clock[end_idx],
+        'end_reason': end_reason[end_idx],
+        'event_count': end_idx - start_idx + 1
+    })
+    
+    logger.debug("POSSESSION DEBUG: Identified %d possessions", len(possessions))
+    
+    return possessions
 
 
 def _count_player_possessions(possessions_df: pd.DataFrame, 
@@ -160,58 +165,43 @@ def _count_player_possessions(possessions_df: pd.DataFrame,
                              team_mapping: Dict[int, int]) -> pd.DataFrame:
     """Count offensive and defensive possessions for each player."""
     
-    player_possession_counts = {}  # player_id -> {'offensive': count, 'defensive': count}
+    # Factorize player IDs once so counts accumulate into flat integer arrays
+    player_codes, player_ids = pd.factorize(lineup_intervals['playerId'])
+    interval_teams = lineup_intervals['teamId'].to_numpy()
     
-    print(f"POSSESSION DEBUG: Counting possessions for {len(possessions_df)} possessions")
+    logger.debug("POSSESSION DEBUG: Counting possessions for %d possessions", len(possessions_df))
     
-    for _, possession in possessions_df.iterrows():
-        if pd.isna(possession['offensive_team']) or pd.isna(possession['defensive_team']):
-            continue
-            
-        offensive_team = int(possession['offensive_team'])
-        defensive_team = int(possession['defensive_team'])
-        
-        # Find players on court during this possession
-        # Use middle of possession for lookup
-        mid_period = possession['start_period']
-        mid_wallClock = (possession['start_wallClock'] + possession['end_wallClock']) / 2
-        
-        # Find players on court at this time
-        players_on_court = lineup_intervals[
-            (lineup_intervals['period_start'] <= mid_period) &
-            (lineup_intervals['period_end'] >= mid_period) &
-            (lineup_intervals['wallClock_start'] <= mid_wallClock) &
-            (lineup_intervals['wallClock_end'] >= mid_wallClock)
-        ]
-        
-        # Count possessions for each player
-        for _, player_interval in players_on_court.iterrows():
-            player_id = player_interval['playerId']
-            player_team = player_interval['teamId']
-            
-            # Initialize player if not seen before
-            if player_id not in player_possession_counts:
-                player_possession_counts[player_id] = {'offensive': 0, 'defensive': 0}
-            
-            # Increment appropriate possession count
-            if player_team == offensive_team:
-                player_possession_counts[player_id]['offensive'] += 1
-            elif player_team == defensive_team:
-                player_possession_counts[player_id]['defensive'] += 1
-    
-    # Convert to DataFrame
-    result_data = []
-    for player_id, counts in player_possession_counts.items():
-        result_data.append({
-            'playerId': player_id,
-            'offensive_possessions': counts['offensive'],
-            'defensive_possessions': counts['defensive'],
-            'total_possessions': counts['offensive'] + counts['defensive']
-        })
-    
-    result_df = pd.DataFrame(result_data)
-    
-    print(f"POSSESSION DEBUG: Calculated possessions for {len(result_df)} players")
+    # Only possessions with both teams known are counted (an empty frame may have no columns)
+    possessions_df = possessions_df.reindex(
+        columns=['start_period', 'start_wallClock', 'end_wallClock', 'offensive_team', 'defensive_team']
+    ).dropna(subset=['offensive_team', 'defensive_team'])
+    offensive_team = possessions_df['offensive_team'].to_numpy()
+    defensive_team = possessions_df['defensive_team'].to_numpy()
+    
+    # Find players on court at the middle of each possession
+    mid_period = possessions_df['start_period'].to_numpy()
+    mid_wallClock = (possessions_df['start_wallClock'].to_numpy() + possessions_df['end_wallClock'].to_numpy()) / 2
+    possession_pos, interval_pos = build_onfloor_index(lineup_intervals)(mid_period, mid_wallClock)
+    
+    codes = player_codes[interval_pos]
+    teams = interval_teams[interval_pos]
+    seen = np.bincount(codes, minlength=len(player_ids)) > 0
+    
+    # Count pairs where the player's team is on offense or defense
+    is_offense = teams == offensive_team[possession_pos]
+    is_defense = teams == defensive_team[possession_pos]
+    offensive_counts = np.bincount(codes[is_offense], minlength=len(player_ids))
+    defensive_counts = np.bincount(codes[is_defense], minlength=len(player_ids))
+    
+    # Restore player IDs from codes once at the end
+    result_df = pd.DataFrame({
+        'playerId': player_ids[seen],
+        'offensive_possessions': offensive_counts[seen],
+        'defensive_possessions': defensive_counts[seen],
+        'total_possessions': offensive_counts[seen] + defensive_counts[seen]
+    })
+    
+    logger.debug("POSSESSION DEBUG: Calculated possessions for %d players", len(result_df))
     
     return result_df
 
@@ -237,14 +227,14 @@ def validate_possession_counts(possession_counts: pd.DataFrame, box_score_df: pd
     }).reset_index()
     
     print("Team possession totals:")
-    for _, team in team_totals.iterrows():
-        print(f"  Team {team['nbaTeamId']}: {team['offensive_possessions']} offensive, {team['defensive_possessions']} defensive")
+    for team in team_totals.itertuples(index=False):
+        print(f"  Team {team.nbaTeamId}: {team.offensive_possessions} offensive, {team.defensive_possessions} defensive")
     
     # Show top players by possession count
     print(f"\nTop 10 players by total possessions:")
     top_players = validation.nlargest(10, 'total_possessions')
-    for _, player in top_players.iterrows():
-        print(f"  {player['name']}: {player['offensive_possessions']} off, {player['defensive_possessions']} def, {player['total_possessions']} total ({player['min']:.1f} min)")
+    for player in top_players.itertuples(index=False):
+        print(f"  {player.name}: {player.offensive_possessions} off, {player.defensive_possessions} def, {player.total_possessions} total ({player.min:.1f} min)")
     
     # Sanity checks
     total_offensive = validation['offensive_possessions'].sum()
@@ -266,6 +256,8 @@ def validate_possession_counts(possession_counts: pd.DataFrame, box_score_df: pd
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     # Load test data
     box_score_df = pd.read_csv("../../data/box_HOU-DAL.csv")
     pbp_df = pd.read_csv("../../data/pbp_HOU-DAL.csv")
@@ -4,9 +4,32 @@
 Track rim defense statistics for each player (on court vs off court performance).
 """
 
+import logging
+
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Set
 
+try:
+    from .court_time import build_onfloor_index
+except ImportError:  # run as a script from this directory
+    from court_time import build_onfloor_index
+
+logger = logging.getLogger(__name__)
+
+# Output columns and dtypes of the rim defense stats table
+_RIM_DEFENSE_DTYPES = {
+    'playerId': 'int64',
+    'teamId': 'int64',
+    'rim_fgm_on': 'int64',
+    'rim_fga_on': 'int64',
+    'rim_fgm_off': 'int64',
+    'rim_fga_off': 'int64',
+    'rim_fg_pct_on': 'float64',
+    'rim_fg_pct_off': 'float64',
+    'rim_fg_pct_diff': 'float64',
+}
+
 
 def track_rim_defense(enhanced_pbp_df: pd.DataFrame, 
                      lineup_intervals: pd.DataFrame) -> pd.DataFrame:
@@ -23,7 +46,11 @@ def track_rim_defense(enhanced_pbp_df: pd.DataFrame,
     # Filter for rim shots only
     rim_shots = enhanced_pbp_df[enhanced_pbp_df['is_rim_shot'] == True].copy()
     
-    print(f"RIM DEFENSE DEBUG: Processing {len(rim_shots)} rim shots")
+    logger.debug("RIM DEFENSE DEBUG: Processing %d rim shots", len(rim_shots))
+    
+    # No rim shots means no defender has any attempts to count
+    if rim_shots.empty:
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in _RIM_DEFENSE_DTYPES.items()})
     
     # Get team assignments for all players
     player_teams = _get_player_team_mapping(lineup_intervals)
@@ -36,11 +63,8 @@ def track_rim_defense(enhanced_pbp_df: pd.DataFrame,
 
 def _get_player_team_mapping(lineup_intervals: pd.DataFrame) -> Dict[int, int]:
     """Create mapping of player ID to team ID from lineup intervals."""
-    player_teams = {}
-    for _, interval in lineup_intervals.iterrows():
-        player_teams[interval['playerId']] = interval['teamId']
-    
-    return player_teams
+    # Later intervals win for a player listed more than once, as before
+    return dict(zip(lineup_intervals['playerId'].tolist(), lineup_intervals['teamId'].tolist()))
 
 
 def _calculate_rim_defense_stats(rim_shots: pd.DataFrame, 
@@ -48,88 +72,76 @@ def _calculate_rim_defense_stats(rim_shots: pd.DataFrame,
                                 player_teams: Dict[int, int]) -> pd.DataFrame:
     """Calculate rim defense statistics for each player."""
     
-    # Initialize stats tracking
-    player_stats = {}  # player_id -> {'on': {'makes': 0, 'attempts': 0}, 'off': {'makes': 0, 'attempts': 0}}
+    # Factorize player IDs once so stats accumulate into flat integer arrays
+    player_ids = np.fromiter(player_teams.keys(), dtype=np.int64, count=len(player_teams))
+    player_team_ids = np.fromiter(player_teams.values(), dtype=np.int64, count=len(player_teams))
+    interval_codes = pd.Index(player_ids).get_indexer(lineup_intervals['playerId'])
+    interval_teams = lineup_intervals['teamId'].to_numpy()
+    
+    # Only shots with both teams known are counted
+    valid_shot = rim_shots['offTeamId'].notna().to_numpy() & rim_shots['defTeamId'].notna().to_numpy()
+    shot_made = rim_shots['msgType'].to_numpy() == 1  # msgType 1 = made shot
+    defensive_team = rim_shots['defTeamId'].to_numpy()
+    
+    logger.debug("RIM DEFENSE DEBUG: Calculating stats for %d players", len(player_teams))
+    
+    # Team totals: every defensive team player is on or off court for each shot against the team
+    player_team_codes, team_ids = pd.factorize(player_team_ids)
+    shot_team_codes = pd.Index(team_ids).get_indexer(defensive_team)
+    counted = valid_shot & (shot_team_codes >= 0)
+    team_attempts = np.bincount(shot_team_codes[counted], minlength=len(team_ids))
+    team_makes = np.bincount(shot_team_codes[counted & shot_made], minlength=len(team_ids))
+    seen = team_attempts[player_team_codes] > 0
+    
+    # Defenders on court at each shot, one entry per (shot, player)
+    shot_pos, interval_pos = build_onfloor_index(lineup_intervals)(
+        rim_shots['period'].to_numpy(), rim_shots['wallClockInt'].to_numpy()
+    )
     
-    print(f"RIM DEFENSE DEBUG: Calculating stats for {len(player_teams)} players")
+    # Interval players missing from player_teams have no code and are skipped
+    mapped = interval_codes[interval_pos] >= 0
+    shot_pos, interval_pos = shot_pos[mapped], interval_pos[mapped]
+    codes = interval_codes[interval_pos]
+    defending = (
+        valid_shot[shot_pos] &
+        (interval_teams[interval_pos] == defensive_team[shot_pos]) &
+        (player_team_ids[codes] == defensive_team[shot_pos])
+    )
+    on_court = np.unique(shot_pos[defending] * len(player_ids) + codes[defending])
+    on_shots, on_codes = np.divmod(on_court, max(len(player_ids), 1))
     
-    for _, shot in rim_shots.iterrows():
-        # Determine shot details
-        shot_made = (shot['msgType'] == 1)  # msgType 1 = made shot
-        shot_period = shot['period']
-        shot_wallClock = shot['wallClockInt']
-        
-        # Determine defending team (opposite of offensive team)
-        offensive_team = shot['offTeamId']
-        defensive_team = shot['defTeamId']
-        
-        if pd.isna(offensive_team) or pd.isna(defensive_team):
-            continue
-            
-        offensive_team = int(offensive_team)
-        defensive_team = int(defensive_team)
-        
-        # Find players on court during this shot
-        players_on_court = lineup_intervals[
-            (lineup_intervals['period_start'] <= shot_period) &
-            (lineup_intervals['period_end'] >= shot_period) &
-            (lineup_intervals['wallClock_start'] <= shot_wallClock) &
-            (lineup_intervals['wallClock_end'] >= shot_wallClock)
-        ]
-        
-        # Get defending players (players on court for defensive team)
-        defending_players = players_on_court[
-            players_on_court['teamId'] == defensive_team
-        ]['playerId'].tolist()
-        
-        # Track stats for all defensive team players
-        defensive_team_players = [pid for pid, tid in player_teams.items() if tid == defensive_team]
-        
-        for player_id in defensive_team_players:
-            # Initialize player stats if not seen before
-            if player_id not in player_stats:
-                player_stats[player_id] = {
-                    'on': {'makes': 0, 'attempts': 0},
-                    'off': {'makes': 0, 'attempts': 0},
-                    'teamId': defensive_team
-                }
-            
-            # Determine if player was on court or off court
-            if player_id in defending_players:
-                # Player was on court defending
-                player_stats[player_id]['on']['attempts'] += 1
-                if shot_made:
-                    player_stats[player_id]['on']['makes'] += 1
-            else:
-                # Player was off court
-                player_stats[player_id]['off']['attempts'] += 1
-                if shot_made:
-                    player_stats[player_id]['off']['makes'] += 1
-    
-    # Convert to DataFrame
-    result_data = []
-    for player_id, stats in player_stats.items():
-        result_data.append({
-            'playerId': player_id,
-            'teamId': stats['teamId'],
-            'rim_fgm_on': stats['on']['makes'],
-            'rim_fga_on': stats['on']['attempts'],
-            'rim_fgm_off': stats['off']['makes'],
-            'rim_fga_off': stats['off']['attempts']
-        })
-    
-    result_df = pd.DataFrame(result_data)
-    
-    # Calculate rim FG% on and off court
-    result_df['rim_fg_pct_on'] = result_df['rim_fgm_on'] / result_df['rim_fga_on'].replace(0, 1)
-    result_df['rim_fg_pct_off'] = result_df['rim_fgm_off'] / result_df['rim_fga_off'].replace(0, 1)
-    result_df['rim_fg_pct_diff'] = result_df['rim_fg_pct_on'] - result_df['rim_fg_pct_off']
+    # On court counts per player; off court is the rest of the team's shots
+    attempts_on = np.bincount(on_codes, minlength=len(player_ids))
+    makes_on = np.bincount(on_codes[shot_made[on_shots]], minlength=len(player_ids))
+    attempts_off = team_attempts[player_team_codes] - attempts_on
+    makes_off = team_makes[player_team_codes] - makes_on
     
-    # Handle cases where players have 0 attempts
-    result_df['rim_fg_pct_on'] = result_df['rim_fg_pct_on'].where(result_df['rim_fga_on'] > 0, None)
-    result_df['rim_fg_pct_off'] = result_df['rim_fg_pct_off'].where(result_df['rim_fga_off'] > 0, None)
+    makes_on, attempts_on = makes_on[seen], attempts_on[seen]
+    makes_off, attempts_off = makes_off[seen], attempts_off[seen]
+    
+    # Calculate rim FG% on and off court; 0 attempts count as 0% for the difference
+    pct_on = np.divide(makes_on, attempts_on, out=np.zeros(len(makes_on)), where=attempts_on > 0)
+    pct_off = np.divide(makes_off, attempts_off, out=np.zeros(len(makes_off)), where=attempts_off > 0)
+    pct_diff = pct_on - pct_off
     
-    print(f"RIM DEFENSE DEBUG: Calculated rim defense stats for {len(result_df)} players")
+    # Handle cases where players have 0 attempts
+    pct_on[attempts_on == 0] = np.nan
+    pct_off[attempts_off == 0] = np.nan
+    
+    # Restore player IDs from codes once at the end
+    result_df = pd.DataFrame({
+        'playerId': player_ids[seen],
+        'teamId': player_team_ids[seen],
+        'rim_fgm_on': makes_on,
+        'rim_fga_on': attempts_on,
+        'rim_fgm_off': makes_off,
+        'rim_fga_off': attempts_off,
+        'rim_fg_pct_on': pct_on,
+        'rim_fg_pct_off': pct_off,
+        'rim_fg_pct_diff': pct_diff
+    })
+    
+    logger.debug("RIM DEFENSE DEBUG: Calculated rim defense stats for %d players", len(result_df))
     
     return result_df
 
@@ -168,8 +180,8 @@ def validate_rim_defense_stats(rim_defense_df: pd.DataFrame,
     
     if len(qualified_defenders) > 0:
         top_defenders = qualified_defenders.nsmallest(10, 'rim_fg_pct_on')
-        for _, defender in top_defenders.iterrows():
-            print(f"  {defender['name']}: {defender['rim_fg_pct_on']:.3f} FG% allowed ({defender['rim_fgm_on']}/{defender['rim_fga_on']})")
+        for defender in top_defenders.itertuples(index=False):
+            print(f"  {defender.name}: {defender.rim_fg_pct_on:.3f} FG% allowed ({defender.rim_fgm_on}/{defender.rim_fga_on})")
     
     # Show biggest on/off impact (negative diff = better when on court)
     print(f"\n=== BIGGEST DEFENSIVE IMPACT (On/Off Difference) ===")
@@ -181,11 +193,11 @@ def validate_rim_defense_stats(rim_defense_df: pd.DataFrame,
     
     if len(qualified_impact) > 0:
         biggest_impact = qualified_impact.nsmallest(10, 'rim_fg_pct_diff')  # Most negative = best impact
-        for _, player in biggest_impact.iterrows():
-            on_pct = player['rim_fg_pct_on']
-            off_pct = player['rim_fg_pct_off']
-            diff = player['rim_fg_pct_diff']
-            print(f"  {player['name']}: {on_pct:.3f} on vs {off_pct:.3f} off (diff: {diff:+.3f})")
+        for player in biggest_impact.itertuples(index=False):
+            on_pct = player.rim_fg_pct_on
+            off_pct = player.rim_fg_pct_off
+            diff = player.rim_fg_pct_diff
+            print(f"  {player.name}: {on_pct:.3f} on vs {off_pct:.3f} off (diff: {diff:+.3f})")
     
     # Team-level validation
     print(f"\n=== TEAM TOTALS ===")
@@ -196,15 +208,17 @@ def validate_rim_defense_stats(rim_defense_df: pd.DataFrame,
         'rim_fgm_off': 'sum'
     }).reset_index()
     
-    for _, team in team_totals.iterrows():
-        team_fg_pct_on = team['rim_fgm_on'] / team['rim_fga_on'] if team['rim_fga_on'] > 0 else 0
-        team_fg_pct_off = team['rim_fgm_off'] / team['rim_fga_off'] if team['rim_fga_off'] > 0 else 0
-        print(f"  Team {team['nbaTeamId']}: {team_fg_pct_on:.3f} FG% on court, {team_fg_pct_off:.3f} FG% off court")
+    for team in team_totals.itertuples(index=False):
+        team_fg_pct_on = team.rim_fgm_on / team.rim_fga_on if team.rim_fga_on > 0 else 0
+        team_fg_pct_off = team.rim_fgm_off / team.rim_fga_off if team.rim_fga_off > 0 else 0
+        print(f"  Team {team.nbaTeamId}: {team_fg_pct_on:.3f} FG% on court, {team_fg_pct_off:.3f} FG% off court")
     
     return validation
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     # Load test data
     box_score_df = pd.read_csv("../../data/box_HOU-DAL.csv")
     pbp_df = pd.read_csv("../../data/pbp_HOU-DAL.csv")
@@ -19,29 +19,23 @@ def calculate_shot_distances(pbp_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Enhanced PBP dataframe with shot_distance and is_rim_shot columns
     """
-    # Create copy to avoid mutating input
-    enhanced_pbp = pbp_df.copy()
-    
     # Only process shot attempts (filter by relevant msgTypes)
-    shot_mask = _is_shot_attempt(enhanced_pbp)
-    
-    # Calculate distances only for shots
-    enhanced_pbp.loc[shot_mask, 'shot_distance'] = _calculate_distance_from_basket(
-        enhanced_pbp.loc[shot_mask, 'locX'].values,
-        enhanced_pbp.loc[shot_mask, 'locY'].values
-    )
+    shot_mask = _is_shot_attempt(pbp_df).to_numpy()
     
-    # Mark rim shots (≤4 feet)
-    enhanced_pbp['is_rim_shot'] = (
-        shot_mask & 
-        (enhanced_pbp['shot_distance'] <= 4.0)
+    # Distance for every row is cheap; non-shots are then branch-selected to -1
+    distances = _calculate_distance_from_basket(
+        pbp_df['locX'].to_numpy(dtype=np.float64),
+        pbp_df['locY'].to_numpy(dtype=np.float64)
     )
+    has_distance = shot_mask & ~np.isnan(distances)
     
-    # Fill non-shots with appropriate values
-    enhanced_pbp['shot_distance'] = enhanced_pbp['shot_distance'].fillna(-1)
-    enhanced_pbp['is_rim_shot'] = enhanced_pbp['is_rim_shot'].fillna(False)
+    # Mark rim shots (≤4 feet), then overwrite non-shots in the same buffer,
+    # so no NaN ever reaches the output column
+    is_rim_shot = has_distance & (distances <= 4.0)
+    distances[~has_distance] = -1.0
     
-    return enhanced_pbp
+    # Return a new frame to avoid mutating input
+    return pbp_df.assign(shot_distance=distances, is_rim_shot=is_rim_shot)
 
 
 def _is_shot_attempt(pbp_df: pd.DataFrame) -> pd.Series:
@@ -50,8 +44,9 @@ def _is_shot_attempt(pbp_df: pd.DataFrame) -> pd.Series:
     
     Typical NBA shot msgTypes: 1 (Made Field Goal), 2 (Missed Field Goal)
     """
-    shot_msg_types = [1, 2]  # Made and missed field goals
-    return pbp_df['msgType'].isin(shot_msg_types)
+    msg_type = pbp_df['msgType'].to_numpy()
+    is_shot = (msg_type == 1) | (msg_type == 2)  # Made and missed field goals
+    return pd.Series(is_shot, index=pbp_df.index, name='msgType')
 
 
 def _calculate_distance_from_basket(loc_x: np.ndarray, loc_y: np.ndarray) -> np.ndarray:
@@ -61,15 +56,12 @@ def _calculate_distance_from_basket(loc_x: np.ndarray, loc_y: np.ndarray) -> np.
     Assumes NBA coordinate system where basket is at (0, 0).
     Distance returned in feet.
     """
-    # NBA court coordinate system typically has basket at origin
-    basket_x, basket_y = 0, 0
-    
-    # Convert coordinates to feet (assuming input is in tenths of feet)
-    x_feet = loc_x / 10.0
-    y_feet = loc_y / 10.0
+    # NBA court coordinate system typically has basket at origin, so the
+    # Euclidean distance is hypot(x, y): one pass, no squared temporaries
+    distances = np.hypot(loc_x, loc_y)
     
-    # Calculate Euclidean distance
-    distances = np.sqrt((x_feet - basket_x) ** 2 + (y_feet - basket_y) ** 2)
+    # Convert to feet in place (assuming input is in tenths of feet)
+    distances /= 10.0
     
     return distances
 
@@ -3,10 +3,29 @@
 """
 Pandera schemas for PBP and Box Score data validation.
 """
+import functools
+import types
+
+import numpy as np
+import pandas as pd
 import pandera.pandas as pa
 from pandera.typing import DataFrame, Series
 
 
+def _narrow_exact(series: pd.Series, dtype: type) -> pd.Series:
+    """
+    Cast an integer column to a narrower integer dtype without loss.
+    
+    Non-integer, missing or out-of-range values are returned unchanged, so the
+    schema's dtype check still rejects them instead of truncating or wrapping.
+    """
+    if not pd.api.types.is_integer_dtype(series) or series.isna().any():
+        return series
+    
+    narrowed = series.astype(dtype)
+    return narrowed if (narrowed == series).all() else series
+
+
 class BoxScoreSchema(pa.DataFrameModel):
     """Schema for box_score DataFrame."""
     
@@ -33,7 +52,7 @@ class BoxScoreSchema(pa.DataFrameModel):
     # Player info
     nbaId: Series[int]
     name: Series[str]
-    jerseyNum: Series[int]
+    jerseyNum: Series[np.int32]
     gp: Series[int]
     gs: Series[int]
     startPos: Series[str] = pa.Field(nullable=True)
@@ -72,6 +91,11 @@ class BoxScoreSchema(pa.DataFrameModel):
     status: Series[str]
     notPlayingReason: Series[str] = pa.Field(nullable=True)
     notPlayingDescription: Series[str] = pa.Field(nullable=True)
+    
+    @pa.parser('jerseyNum')
+    @classmethod
+    def _narrow_int32(cls, series: pd.Series) -> pd.Series:
+        return _narrow_exact(series, np.int32)
 
 
 class PbpSchema(pa.DataFrameModel):
@@ -93,26 +117,26 @@ class PbpSchema(pa.DataFrameModel):
     offTeamId: Series[int]
     defTeamId: Series[int]
     pbpId: Series[int]
-    period: Series[int]
+    period: Series[np.int16]
     gameClock: Series[str]
     wallClock: Series[str]
     wallClockInt: Series[int]
     description: Series[str] = pa.Field(nullable=True)
     
     # Event classification
-    msgType: Series[int]
-    actionType: Series[int]
-    option1: Series[int]
-    option2: Series[int]
-    option3: Series[int]
-    option4: Series[int]
+    msgType: Series[np.int16]
+    actionType: Series[np.int16]
+    option1: Series[np.int32]
+    option2: Series[np.int32]
+    option3: Series[np.int32]
+    option4: Series[np.int32]
     
     # Score and location
     homeScore: Series[int]
     awayScore: Series[int]
-    locX: Series[int]
-    locY: Series[int]
-    pts: Series[int]
+    locX: Series[np.int16]
+    locY: Series[np.int16]
+    pts: Series[np.int16]
     pbpOrder: Series[int]
     
     # Player involvement (nullable)
@@ -124,6 +148,16 @@ class PbpSchema(pa.DataFrameModel):
     lastName3: Series[str] = pa.Field(nullable=True)
     statCategory1: Series[str] = pa.Field(nullable=True)
     statCategory2: Series[str] = pa.Field(nullable=True)
+    
+    @pa.parser('period', 'msgType', 'actionType', 'locX', 'locY', 'pts')
+    @classmethod
+    def _narrow_int16(cls, series: pd.Series) -> pd.Series:
+        return _narrow_exact(series, np.int16)
+    
+    @pa.parser('option1', 'option2', 'option3', 'option4')
+    @classmethod
+    def _narrow_int32(cls, series: pd.Series) -> pd.Series:
+        return _narrow_exact(series, np.int32)
 
 
 class PbpActionTypesSchema(pa.DataFrameModel):
@@ -154,22 +188,38 @@ class PbpOptionTypesSchema(pa.DataFrameModel):
     Description: Series[str]
 
 
-# Schema registry for easy access
-SCHEMAS = {
+# Schema registry for easy access; read-only so the compiled-schema cache stays valid
+SCHEMAS = types.MappingProxyType({
     'box_score': BoxScoreSchema,
     'pbp': PbpSchema,
     'pbp_action_types': PbpActionTypesSchema,
     'pbp_event_msg_types': PbpEventMsgTypesSchema,
     'pbp_option_types': PbpOptionTypesSchema,
-}
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled(schema_name: str) -> pa.DataFrameSchema:
+    """
+    Return the DataFrameSchema for a registered model.
+    
+    DataFrameModel.to_schema() already caches the schema on the class, so this
+    only gives callers one shared object per schema name; it is not a speedup.
+    """
+    return SCHEMAS[schema_name].to_schema()
 
 
 def validate_dataframe(df: DataFrame, schema_name: str) -> DataFrame:
-    """Validate a DataFrame against a schema."""
+    """
+    Validate a DataFrame against a schema.
+    
+    Validation is lazy: every failing check is collected and raised together
+    as a pandera SchemaErrors.
+    """
     if schema_name not in SCHEMAS:
         raise ValueError(f"Unknown schema: {schema_name}")
     
-    return SCHEMAS[schema_name].validate(df)
+    return _compiled(schema_name).validate(df, lazy=True)
 
 
 def get_schema(schema_name: str) -> pa.DataFrameModel:
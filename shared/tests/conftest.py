@@ -0,0 +1,47 @@
+# shared/tests/conftest.py
+
+import contextlib
+
+import pytest
+import pandas as pd
+
+from ..schemas import SCHEMAS, _compiled
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even when pytest-xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on the same pytest-xdist worker"
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def copy_on_write():
+    """Run each shared test module with pandas Copy-on-Write enabled.
+    
+    Schema tests derive variants from shared read-only frames, and CoW makes
+    those derived frames copy lazily. It is always on from pandas 3.0, where
+    the option is deprecated, so it is only set on older versions. The option
+    is restored after the module, leaving other packages' tests unaffected.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        context = pd.option_context('mode.copy_on_write', True)
+    else:
+        context = contextlib.nullcontext()
+    with context:
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def compiled_schemas():
+    """Build every registered schema and run it once on an empty frame.
+    
+    This pays pandera's first-validation setup before any test runs,
+    once per session (or per xdist worker).
+    """
+    compiled = {name: _compiled(name) for name in SCHEMAS}
+    for schema in compiled.values():
+        schema.validate(pd.DataFrame({
+            name: pd.Series(dtype=column.dtype.type) for name, column in schema.columns.items()
+        }))
+    return compiled
@@ -0,0 +1,142 @@
+# shared/tests/frames.py
+
+import pandas as pd
+import numpy as np
+
+# Valid one-row frames for every registered schema, shared by the schema tests
+# and benchmarks. They are built once at import and used read-only: tests derive
+# variants from them. Columns that schemas narrow are built with the target
+# dtype so narrowing is a no-op, and all-null text columns use the nullable
+# 'string' dtype so they keep real nulls (astype('str') turns None into 'None'
+# on pandas 2.x).
+
+# Game identifier columns shared by the box score and PBP frames
+_BASE_GAME_DTYPES = [
+    ('gameId', 'str'),
+    ('nbaGameId', 'int64'),
+    ('date', 'str'),
+    ('season', 'int64'),
+    ('seasonType', 'str'),
+]
+_BASE_GAME_ROW = ('001', 1, '2024-01-01', 2024, 'Regular')
+
+_BOX_SCORE_DTYPES = _BASE_GAME_DTYPES + [
+    ('nbaTeamId', 'int64'),
+    ('team', 'str'),
+    ('opponentId', 'int64'),
+    ('opponent', 'str'),
+    ('teamPts', 'int64'),
+    ('oppPts', 'int64'),
+    ('teamMargin', 'int64'),
+    ('outcome', 'str'),
+    ('isHome', 'int64'),
+    ('nbaId', 'int64'),
+    ('name', 'str'),
+    ('jerseyNum', 'int32'),
+    ('gp', 'int64'),
+    ('gs', 'int64'),
+    ('startPos', 'str'),
+    ('isOnCourt', 'int64'),
+    ('boxScoreOrder', 'int64'),
+    ('minDisplay', 'int64'),
+    ('secDisplay', 'int64'),
+    ('min', 'float64'),
+    ('secPlayed', 'int64'),
+    ('fgm', 'int64'),
+    ('fga', 'int64'),
+    ('ftm', 'int64'),
+    ('fta', 'int64'),
+    ('tpm', 'int64'),
+    ('tpa', 'int64'),
+    ('oreb', 'int64'),
+    ('dreb', 'int64'),
+    ('reb', 'int64'),
+    ('ast', 'int64'),
+    ('stl', 'int64'),
+    ('blk', 'int64'),
+    ('tov', 'int64'),
+    ('pf', 'int64'),
+    ('pts', 'int64'),
+    ('plusMinus', 'int64'),
+    ('blkA', 'int64'),
+    ('gameStatus', 'int64'),
+    ('status', 'str'),
+    ('notPlayingReason', 'string'),
+    ('notPlayingDescription', 'string'),
+]
+_BOX_SCORE_ROW = _BASE_GAME_ROW + (
+    1610612745, 'HOU', 1610612742, 'DAL', 110, 105, 5, 'W', 1, 201935,
+    'James Harden', 1, 1, 1, 'G', 1, 1, 35, 30, 35.5, 2130, 8, 15, 5, 6, 3, 8,
+    1, 5, 6, 8, 2, 0, 3, 2, 24, 8, 0, 3, 'Active', None, None,
+)
+BOX_SCORE_FRAME = pd.DataFrame.from_records(
+    [_BOX_SCORE_ROW], columns=[col for col, _ in _BOX_SCORE_DTYPES]
+).astype(dict(_BOX_SCORE_DTYPES))
+
+
+_PBP_DTYPES = _BASE_GAME_DTYPES + [
+    ('nbaTeamId', 'float64'),
+    ('team', 'str'),
+    ('opponent', 'str'),
+    ('offTeamId', 'int64'),
+    ('defTeamId', 'int64'),
+    ('pbpId', 'int64'),
+    ('period', 'int16'),
+    ('gameClock', 'str'),
+    ('wallClock', 'str'),
+    ('wallClockInt', 'int64'),
+    ('description', 'str'),
+    ('msgType', 'int16'),
+    ('actionType', 'int16'),
+    ('option1', 'int32'),
+    ('option2', 'int32'),
+    ('option3', 'int32'),
+    ('option4', 'int32'),
+    ('homeScore', 'int64'),
+    ('awayScore', 'int64'),
+    ('locX', 'int16'),
+    ('locY', 'int16'),
+    ('pts', 'int16'),
+    ('pbpOrder', 'int64'),
+    ('playerId1', 'float64'),
+    ('playerId2', 'float64'),
+    ('playerId3', 'float64'),
+    ('lastName1', 'str'),
+    ('lastName2', 'string'),
+    ('lastName3', 'string'),
+    ('statCategory1', 'str'),
+    ('statCategory2', 'string'),
+]
+_PBP_ROW = _BASE_GAME_ROW + (
+    1610612745.0, 'HOU', 'DAL', 1610612745, 1610612742, 1, 1, '12:00',
+    '7:00 PM', 1900, 'Jump ball', 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1,
+    201935.0, np.nan, np.nan, 'Harden', None, None, 'FGM', None,
+)
+PBP_FRAME = pd.DataFrame.from_records(
+    [_PBP_ROW], columns=[col for col, _ in _PBP_DTYPES]
+).astype(dict(_PBP_DTYPES))
+
+
+ACTION_TYPES_FRAME = pd.DataFrame({
+    'EventType': [1],
+    'ActionType': [10],
+    'Event': ['Made Shot'],
+    'Description': ['Jump Shot']
+})
+
+
+EVENT_MSG_TYPES_FRAME = pd.DataFrame({
+    'EventType': [1],
+    'Description': ['Made Shot']
+})
+
+
+OPTION_TYPES_FRAME = pd.DataFrame({
+    'Event': ['Made Shot'],
+    'EventType': [1],
+    'Option1': ['Jump Shot'],
+    'Option2': [None],
+    'Option3': [None],
+    'Option4': [np.nan],
+    'Description': ['Player made a jump shot']
+}).astype({'Option2': 'string', 'Option3': 'string'})
@@ -1,233 +1,186 @@
 # shared/tests/test_schemas.py
 
+import re
+
 import pytest
-import pandas as pd
 import numpy as np
-from pandera.errors import SchemaError
+from pandera.errors import SchemaError, SchemaErrors
 
 from ..schemas import (
-    BoxScoreSchema, PbpSchema, PbpActionTypesSchema, 
-    PbpEventMsgTypesSchema, PbpOptionTypesSchema,
-    validate_dataframe, get_schema, SCHEMAS
+    BoxScoreSchema, PbpSchema,
+    validate_dataframe, get_schema, SCHEMAS, _compiled
+)
+from .frames import (
+    BOX_SCORE_FRAME, PBP_FRAME, ACTION_TYPES_FRAME,
+    EVENT_MSG_TYPES_FRAME, OPTION_TYPES_FRAME
 )
 
+# Independent of other modules; with pytest-xdist, `-n auto --dist=loadgroup`
+# keeps this module on one worker so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("schemas")
+
+_UNKNOWN_SCHEMA_RE = re.compile(r"Unknown schema")
+
+_EXPECTED_SCHEMAS = frozenset({
+    'box_score', 'pbp', 'pbp_action_types',
+    'pbp_event_msg_types', 'pbp_option_types'
+})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def valid_box_score_data():
     """Valid BoxScore data for testing."""
-    return pd.DataFrame({
-        'gameId': ['001'],
-        'nbaGameId': [1],
-        'date': ['2024-01-01'],
-        'season': [2024],
-        'seasonType': ['Regular'],
-        'nbaTeamId': [1610612745],
-        'team': ['HOU'],
-        'opponentId': [1610612742],
-        'opponent': ['DAL'],
-        'teamPts': [110],
-        'oppPts': [105],
-        'teamMargin': [5],
-        'outcome': ['W'],
-        'isHome': [1],
-        'nbaId': [201935],
-        'name': ['James Harden'],
-        'jerseyNum': [1],
-        'gp': [1],
-        'gs': [1],
-        'startPos': ['G'],
-        'isOnCourt': [1],
-        'boxScoreOrder': [1],
-        'minDisplay': [35],
-        'secDisplay': [30],
-        'min': [35.5],
-        'secPlayed': [2130],
-        'fgm': [8],
-        'fga': [15],
-        'ftm': [5],
-        'fta': [6],
-        'tpm': [3],
-        'tpa': [8],
-        'oreb': [1],
-        'dreb': [5],
-        'reb': [6],
-        'ast': [8],
-        'stl': [2],
-        'blk': [0],
-        'tov': [3],
-        'pf': [2],
-        'pts': [24],
-        'plusMinus': [8],
-        'blkA': [0],
-        'gameStatus': [3],
-        'status': ['Active'],
-        'notPlayingReason': [None],
-        'notPlayingDescription': [None]
-    })
-
-
-@pytest.fixture
+    return BOX_SCORE_FRAME
+
+
+@pytest.fixture(scope="module")
 def valid_pbp_data():
     """Valid PBP data for testing."""
-    return pd.DataFrame({
-        'gameId': ['001'],
-        'nbaGameId': [1],
-        'date': ['2024-01-01'],
-        'season': [2024],
-        'seasonType': ['Regular'],
-        'nbaTeamId': [1610612745.0],
-        'team': ['HOU'],
-        'opponent': ['DAL'],
-        'offTeamId': [1610612745],
-        'defTeamId': [1610612742],
-        'pbpId': [1],
-        'period': [1],
-        'gameClock': ['12:00'],
-        'wallClock': ['7:00 PM'],
-        'wallClockInt': [1900],
-        'description': ['Jump ball'],
-        'msgType': [10],
-        'actionType': [0],
-        'option1': [0],
-        'option2': [0],
-        'option3': [0],
-        'option4': [0],
-        'homeScore': [0],
-        'awayScore': [0],
-        'locX': [0],
-        'locY': [0],
-        'pts': [0],
-        'pbpOrder': [1],
-        'playerId1': [201935.0],
-        'playerId2': [np.nan],
-        'playerId3': [np.nan],
-        'lastName1': ['Harden'],
-        'lastName2': [None],
-        'lastName3': [None],
-        'statCategory1': ['FGM'],
-        'statCategory2': [None]
-    })
-
-
-@pytest.fixture
+    return PBP_FRAME
+
+
+@pytest.fixture(scope="module")
 def valid_action_types_data():
     """Valid action types data for testing."""
-    return pd.DataFrame({
-        'EventType': [1],
-        'ActionType': [10],
-        'Event': ['Made Shot'],
-        'Description': ['Jump Shot']
-    })
+    return ACTION_TYPES_FRAME
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_event_msg_types_data():
     """Valid event msg types data for testing."""
-    return pd.DataFrame({
-        'EventType': [1],
-        'Description': ['Made Shot']
-    })
+    return EVENT_MSG_TYPES_FRAME
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_option_types_data():
     """Valid option types data for testing."""
-    return pd.DataFrame({
-        'Event': ['Made Shot'],
-        'EventType': [1],
-        'Option1': ['Jump Shot'],
-        'Option2': [None],
-        'Option3': [None],
-        'Option4': [np.nan],
-        'Description': ['Player made a jump shot']
-    })
-
-
-class TestBoxScoreSchema:
-    """Test BoxScore schema validation."""
-    
-    def test_valid_data_passes(self, valid_box_score_data):
-        """Test that valid data passes validation."""
-        result = BoxScoreSchema.validate(valid_box_score_data)
-        assert len(result) == 1
+    return OPTION_TYPES_FRAME
+
+
+@pytest.fixture(scope="session")
+def validated_box_score():
+    """Box score frame validated once through validate_dataframe."""
+    return validate_dataframe(BOX_SCORE_FRAME, 'box_score')
+
+
+# Valid data passes every registered schema
+@pytest.mark.parametrize("schema_name,fixture_name", [
+    ('box_score', 'valid_box_score_data'),
+    ('pbp', 'valid_pbp_data'),
+    ('pbp_action_types', 'valid_action_types_data'),
+    ('pbp_event_msg_types', 'valid_event_msg_types_data'),
+    ('pbp_option_types', 'valid_option_types_data'),
+])
+def test_valid_data_passes(request, schema_name, fixture_name):
+    """Test that valid data passes validation."""
+    result = SCHEMAS[schema_name].validate(request.getfixturevalue(fixture_name))
+    assert result.shape[0] == 1
+
+
+def test_nullable_fixture_columns_hold_nulls(valid_box_score_data, valid_pbp_data, valid_option_types_data):
+    """Test that all-null text fixture columns contain nulls, not 'None' strings."""
+    assert valid_box_score_data[['notPlayingReason', 'notPlayingDescription']].isna().all().all()
+    assert valid_pbp_data[['lastName2', 'lastName3', 'statCategory2']].isna().all().all()
+    assert valid_option_types_data[['Option2', 'Option3']].isna().all().all()
+
+
+# BoxScore schema validation
+def test_missing_required_field_fails(valid_box_score_data):
+    """Test that missing required fields cause validation to fail."""
+    invalid_data = valid_box_score_data.loc[:, valid_box_score_data.columns.drop('gameId')]
+    with pytest.raises(SchemaError):
+        BoxScoreSchema.validate(invalid_data)
+
+
+def test_wrong_dtype_fails(valid_box_score_data):
+    """Test that wrong data types cause validation to fail."""
+    invalid_data = valid_box_score_data.assign(nbaGameId='not_an_int')
+    with pytest.raises(SchemaError):
+        BoxScoreSchema.validate(invalid_data)
+
+
+# PBP schema validation
+def test_nullable_fields_accept_none(valid_pbp_data):
+    """Test that nullable fields accept None/NaN values."""
+    data_with_nulls = valid_pbp_data.assign(nbaTeamId=np.nan, team=None)
+    result = PbpSchema.validate(data_with_nulls)
+    assert result.shape[0] == 1
+
+
+def test_compact_columns_are_narrowed(valid_pbp_data):
+    """Test that int64 event and location columns are narrowed to compact dtypes."""
+    compact = {
+        'period': np.int16, 'msgType': np.int16, 'actionType': np.int16,
+        'locX': np.int16, 'locY': np.int16, 'pts': np.int16,
+        'option1': np.int32, 'option2': np.int32, 'option3': np.int32, 'option4': np.int32
+    }
+    wide_data = valid_pbp_data.astype(dict.fromkeys(compact, np.int64))
     
-    def test_missing_required_field_fails(self, valid_box_score_data):
-        """Test that missing required fields cause validation to fail."""
-        invalid_data = valid_box_score_data.drop(columns=['gameId'])
-        with pytest.raises(SchemaError):
-            BoxScoreSchema.validate(invalid_data)
+    result = validate_dataframe(wide_data, 'pbp')
     
-    def test_wrong_dtype_fails(self, valid_box_score_data):
-        """Test that wrong data types cause validation to fail."""
-        invalid_data = valid_box_score_data.copy()
-        invalid_data['nbaGameId'] = 'not_an_int'
-        with pytest.raises(SchemaError):
-            BoxScoreSchema.validate(invalid_data)
+    assert result.dtypes[list(compact)].to_dict() == {col: np.dtype(dtype) for col, dtype in compact.items()}
 
 
-class TestPbpSchema:
-    """Test PBP schema validation."""
-    
-    def test_valid_data_passes(self, valid_pbp_data):
-        """Test that valid data passes validation."""
-        result = PbpSchema.validate(valid_pbp_data)
-        assert len(result) == 1
-    
-    def test_nullable_fields_accept_none(self, valid_pbp_data):
-        """Test that nullable fields accept None/NaN values."""
-        data_with_nulls = valid_pbp_data.copy()
-        data_with_nulls['nbaTeamId'] = np.nan
-        data_with_nulls['team'] = None
-        result = PbpSchema.validate(data_with_nulls)
-        assert len(result) == 1
+@pytest.mark.parametrize("period", [1.7, 1.0, 40000])
+def test_compact_columns_reject_lossy_values(valid_pbp_data, period):
+    """Test that non-integer or out-of-range values are rejected, not truncated."""
+    invalid_data = valid_pbp_data.assign(period=period)
+    with pytest.raises(SchemaErrors):
+        validate_dataframe(invalid_data, 'pbp')
 
 
-class TestLookupSchemas:
-    """Test lookup table schemas."""
-    
-    def test_action_types_schema(self, valid_action_types_data):
-        """Test action types schema validation."""
-        result = PbpActionTypesSchema.validate(valid_action_types_data)
-        assert len(result) == 1
-    
-    def test_event_msg_types_schema(self, valid_event_msg_types_data):
-        """Test event msg types schema validation."""
-        result = PbpEventMsgTypesSchema.validate(valid_event_msg_types_data)
-        assert len(result) == 1
-    
-    def test_option_types_schema(self, valid_option_types_data):
-        """Test option types schema validation."""
-        result = PbpOptionTypesSchema.validate(valid_option_types_data)
-        assert len(result) == 1
+# Helper functions
+def test_validate_dataframe_success(validated_box_score):
+    """Test validate_dataframe with valid data."""
+    assert validated_box_score.shape[0] == 1
 
 
-class TestHelperFunctions:
-    """Test helper functions."""
-    
-    def test_validate_dataframe_success(self, valid_box_score_data):
-        """Test validate_dataframe with valid data."""
-        result = validate_dataframe(valid_box_score_data, 'box_score')
-        assert len(result) == 1
-    
-    def test_validate_dataframe_invalid_schema(self, valid_box_score_data):
-        """Test validate_dataframe with invalid schema name."""
-        with pytest.raises(ValueError, match="Unknown schema"):
-            validate_dataframe(valid_box_score_data, 'invalid_schema')
-    
-    def test_get_schema_success(self):
-        """Test get_schema with valid schema name."""
-        schema = get_schema('box_score')
-        assert schema == BoxScoreSchema
+def test_validate_dataframe_collects_all_failures(valid_box_score_data):
+    """Test that validate_dataframe reports every failing check at once."""
+    invalid_data = valid_box_score_data.loc[
+        :, valid_box_score_data.columns.drop('gameId')
+    ].assign(nbaGameId='not_an_int')
+    with pytest.raises(SchemaErrors) as exc_info:
+        validate_dataframe(invalid_data, 'box_score')
+
+    assert len(exc_info.value.schema_errors) >= 2
+
+
+@pytest.mark.parametrize("func,args", [
+    (validate_dataframe, (BOX_SCORE_FRAME, 'invalid_schema')),
+    (get_schema, ('invalid_schema',)),
+])
+def test_invalid_schema_name(func, args):
+    """Test that helpers reject an unknown schema name."""
+    with pytest.raises(ValueError, match=_UNKNOWN_SCHEMA_RE):
+        func(*args)
+
+
+def test_get_schema_success():
+    """Test get_schema with valid schema name."""
+    schema = get_schema('box_score')
+    assert schema == BoxScoreSchema
+
+
+def test_compiled_schema_is_cached(valid_box_score_data, monkeypatch):
+    """Test that validate_dataframe builds the schema once across calls."""
+    calls = []
+    to_schema = BoxScoreSchema.to_schema
+    monkeypatch.setattr(BoxScoreSchema, 'to_schema', lambda: calls.append(1) or to_schema())
+    _compiled.cache_clear()
     
-    def test_get_schema_invalid_name(self):
-        """Test get_schema with invalid schema name."""
-        with pytest.raises(ValueError, match="Unknown schema"):
-            get_schema('invalid_schema')
+    validate_dataframe(valid_box_score_data, 'box_score')
+    validate_dataframe(valid_box_score_data, 'box_score')
     
-    def test_schemas_registry_completeness(self):
-        """Test that SCHEMAS registry contains all expected schemas."""
-        expected_schemas = {
-            'box_score', 'pbp', 'pbp_action_types', 
-            'pbp_event_msg_types', 'pbp_option_types'
-        }
-        assert set(SCHEMAS.keys()) == expected_schemas
\ No newline at end of file
+    assert len(calls) == 1
+
+
+def test_schemas_registry_completeness():
+    """Test that SCHEMAS registry contains all expected schemas."""
+    assert SCHEMAS.keys() == _EXPECTED_SCHEMAS
+
+
+def test_schemas_registry_is_read_only():
+    """Test that SCHEMAS cannot be modified at runtime."""
+    with pytest.raises(TypeError):
+        SCHEMAS['box_score'] = PbpSchema
\ No newline at end of file
@@ -0,0 +1,26 @@
+# shared/tests/test_schemas_bench.py
+
+import pytest
+import pandas as pd
+
+pytest.importorskip("pytest_benchmark")
+
+from ..schemas import BoxScoreSchema
+from .frames import BOX_SCORE_FRAME
+
+# Runs with the suite when pytest-benchmark is installed; leave it out with
+# `--benchmark-skip` or run it alone with `--benchmark-only`
+_BENCH_ROWS = 100_000
+
+
+@pytest.fixture(scope="module")
+def large_box_score_data():
+    """Valid BoxScore fixture row repeated to a realistic season size."""
+    return pd.concat([BOX_SCORE_FRAME] * _BENCH_ROWS, ignore_index=True)
+
+
+@pytest.mark.benchmark(group="schemas", min_rounds=5)
+def test_box_score_validate(benchmark, large_box_score_data):
+    """Benchmark BoxScore validation on a large valid frame."""
+    result = benchmark(BoxScoreSchema.validate, large_box_score_data)
+    assert result.shape[0] == _BENCH_ROWS